@@ -204,7 +204,7 @@ def install(
                 )
 
             # Now pass these to install_docker_sync directly
-            install_docker_sync(
+            status = install_docker_sync(
                 version=version,
                 platform=platform,
                 destination=destination,
@@ -220,7 +220,7 @@ def install(
             )
         else:
             # Standard installation without named volumes
-            install_docker_sync(
+            status = install_docker_sync(
                 version=version,
                 platform=platform,
                 destination=destination,
@@ -230,6 +230,9 @@ def install(
                 verbose=verbose,
                 debug=debug,
             )
+
+        if status == OperationStatus.ERROR:
+            raise typer.Exit(1)
     # Default to local installation if no mode specified
     else:
         install_artifactory(
@@ -290,9 +293,13 @@ def release_notes(
 
 
 @volume_app.command(name="list")
-def volume_list() -> None:
+def volume_list(
+    managed_only: bool = typer.Option(
+        False, "--managed-only", help="Only list volumes created by sapo"
+    ),
+) -> None:
     """List all Docker volumes used by Artifactory."""
-    volume_manager = VolumeManager(console=console)
+    volume_manager = VolumeManager(console=console, managed_only=managed_only)
     volume_manager.display_volumes()
 
 
@@ -467,13 +474,18 @@ def volume_restore(
 def volume_migrate(
     source: str = typer.Option(..., "--source", "-s", help="Source volume name"),
     target: str = typer.Option(..., "--target", "-t", help="Target volume name"),
-    temp_dir: Path = typer.Option(
-        Path.home() / ".jfrog" / "temp",
+    temp_dir: Path | None = typer.Option(
+        None,
         "--temp",
-        help="Temporary directory for migration",
+        help="Migrate through a backup archive in this directory (kept afterwards) "
+        "instead of copying directly",
     ),
 ) -> None:
     """Migrate data from one Artifactory volume to another."""
+    if source == target:
+        console.print("[bold red]Error:[/] Source and target volumes must be different")
+        raise typer.Exit(1)
+
     volume_manager = VolumeManager(console=console)
 
     # Confirm migration
@@ -505,6 +517,12 @@ def import_path(
     ),
     name_suffix: str = typer.Option(None, "--suffix", help="Suffix for volume name"),
     driver: str = typer.Option("local", "--driver", "-d", help="Docker volume driver"),
+    hardlink: bool = typer.Option(
+        False,
+        "--hardlink",
+        help="Hard-link files instead of copying them when the volume is on the "
+        "same filesystem (the source then shares file contents with the volume)",
+    ),
 ) -> None:
     """Import data from a host path into a Docker volume."""
     console = Console()
@@ -517,13 +535,14 @@ def import_path(
             name_suffix
             or f"imported_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}",
             driver=driver,
+            labels=VolumeManager.migration_labels(source_path),
             display_name=f"Imported {volume_type.value} from {source_path.name}",
         )
 
         # Migrate data from path to volume
         success = asyncio.run(
             volume_manager.migrate_from_bind_mount(
-                source_path, target_volume, volume_type
+                source_path, target_volume, volume_type, hardlink=hardlink
             )
         )
 
@@ -1,7 +1,9 @@
 """Common functionality for installation modes."""
 
+import functools
 import shutil
 import subprocess  # nosec B404
+import time
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Union
@@ -27,19 +29,36 @@ class OperationStatus(Enum):
 # sapo.cli.install_mode.common
 
 
+# Docker availability does not change between back-to-back invocations, so the
+# probe result is reused for this many seconds instead of rescanning PATH.
+DOCKER_CHECK_TTL_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=4)
+def _docker_installed_bucket(bucket: int) -> bool:
+    """Probe Docker once per TTL bucket.
+
+    Looking the executable up on PATH is enough to know whether Docker is
+    installed, and avoids forking ``docker --version`` just to find out.
+
+    Args:
+        bucket: Monotonic time bucket; a new bucket forces a fresh probe
+
+    Returns:
+        bool: True if Docker is installed and available
+    """
+    return shutil.which("docker") is not None
+
+
 def check_docker_installed() -> bool:
     """Check if Docker is installed and available.
 
+    The result is cached for ``DOCKER_CHECK_TTL_SECONDS``.
+
     Returns:
         bool: True if Docker is installed and available
     """
-    try:
-        result = run_docker_command(
-            ["docker", "--version"], check=False, capture_output=True
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, ValueError):
-        return False
+    return _docker_installed_bucket(int(time.monotonic() // DOCKER_CHECK_TTL_SECONDS))
 
 
 def run_docker_command(
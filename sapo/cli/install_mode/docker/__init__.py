@@ -5,22 +5,33 @@ generating the necessary docker-compose.yml and system.yaml files.
 """
 
 import asyncio
-import secrets
+import atexit
+import concurrent.futures
 import string
+import threading
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
 import typer
 from rich.console import Console
 
 from ..common import OperationStatus
-from .config import DatabaseType, DockerConfig
+from .config import (
+    _SYSRAND,
+    POSTGRES_PASSWORD_KEY,
+    DatabaseType,
+    DockerConfig,
+    _random_chars,
+    default_data_dir,
+)
 from .container import DockerContainerManager
-from .files import DockerFileManager
 
 # Import volume management functionality
 from .volume import VolumeManager, VolumeType
 
+if TYPE_CHECKING:
+    from .files import DockerFileManager
+
 __all__ = [
     "install_docker",
     "install_docker_sync",
@@ -35,6 +46,38 @@ __all__ = [
     "generate_password",
 ]
 
+# Default named volume sizes, used when the user does not specify one
+_DEFAULT_VOLUME_SIZES: dict[VolumeType, str] = {
+    VolumeType.DATA: "10G",
+    VolumeType.LOGS: "3G",
+    VolumeType.BACKUP: "20G",
+    VolumeType.POSTGRESQL: "15G",
+    VolumeType.ETC: "1G",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported module attributes.
+
+    The file manager pulls in the Jinja2 template machinery, so it is only
+    imported once something actually asks for it.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Any: The requested attribute
+
+    Raises:
+        AttributeError: If the attribute does not exist
+    """
+    if name == "DockerFileManager":
+        from .files import DockerFileManager
+
+        globals()[name] = DockerFileManager
+        return DockerFileManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Compatibility functions for tests
 def generate_files(config: DockerConfig) -> Path:
@@ -48,6 +91,8 @@ def generate_files(config: DockerConfig) -> Path:
     Returns:
         Path: Path to the compose directory
     """
+    from .files import DockerFileManager
+
     console = Console()
     file_manager = DockerFileManager(config, console)
     file_manager.generate_all_files(non_interactive=True)
@@ -111,32 +156,33 @@ async def install_docker(
         config = DockerConfig(
             version=version,
             port=port,
-            data_dir=data_dir or Path.home() / ".jfrog" / "artifactory",
+            data_dir=data_dir or default_data_dir(),
             database_type=DatabaseType.DERBY if use_derby else DatabaseType.POSTGRESQL,
             joinkey=joinkey,
         )
 
-        # Show installation information
-        console.print("[bold]JFrog Artifactory OSS Docker Installation[/]")
-        console.print(f"Version: {config.version}")
-        console.print(f"Port: {config.port}")
-        console.print(f"Data directory: {config.data_dir.absolute()}")
-        console.print(
-            f"Database: {'Derby (Not Recommended)' if config.use_derby else 'PostgreSQL (Recommended)'}"
-        )
-
-        if use_named_volumes:
-            console.print("Storage: Docker named volumes")
-            if volume_driver:
-                console.print(f"Volume driver: {volume_driver}")
-        else:
-            console.print(f"Storage: Bind mounts to {config.data_dir.absolute()}")
-
-        if config.use_derby:
+        # Show installation information (buffered so the block is written once)
+        with console:
+            console.print("[bold]JFrog Artifactory OSS Docker Installation[/]")
+            console.print(f"Version: {config.version}")
+            console.print(f"Port: {config.port}")
+            console.print(f"Data directory: {config.data_dir.absolute()}")
             console.print(
-                "[bold yellow]Warning:[/] Derby database is not recommended for Docker installations and may cause stability issues."
+                f"Database: {'Derby (Not Recommended)' if config.use_derby else 'PostgreSQL (Recommended)'}"
             )
 
+            if use_named_volumes:
+                console.print("Storage: Docker named volumes")
+                if volume_driver:
+                    console.print(f"Volume driver: {volume_driver}")
+            else:
+                console.print(f"Storage: Bind mounts to {config.data_dir.absolute()}")
+
+            if config.use_derby:
+                console.print(
+                    "[bold yellow]Warning:[/] Derby database is not recommended for Docker installations and may cause stability issues."
+                )
+
         # Confirm installation unless in non-interactive mode
         if not non_interactive:
             confirmed = typer.confirm(
@@ -162,9 +208,6 @@ async def install_docker(
                 # Format version for volume name (e.g., 7.9.2 -> v7_9_2)
                 version_suffix = f"v{version.replace('.', '_')}"
 
-                # Create volume options dictionary with sizes
-                volume_opts: dict[VolumeType, dict[str, str]] = {}
-
                 # Only include backup volume if explicitly requested
                 volume_types_to_create = [
                     VolumeType.DATA,
@@ -176,55 +219,55 @@ async def install_docker(
                 if "backup" in volume_sizes:
                     volume_types_to_create.append(VolumeType.BACKUP)
 
-                for volume_type in volume_types_to_create:
-                    # Set defaults by volume type
-                    if volume_type == VolumeType.DATA and "data" not in volume_sizes:
-                        volume_opts[volume_type] = {"size": "10G"}
-                    elif volume_type == VolumeType.LOGS and "logs" not in volume_sizes:
-                        volume_opts[volume_type] = {"size": "3G"}
-                    elif (
-                        volume_type == VolumeType.BACKUP
-                        and "backup" not in volume_sizes
-                    ):
-                        volume_opts[volume_type] = {"size": "20G"}
-                    elif (
-                        volume_type == VolumeType.POSTGRESQL
-                        and "postgresql" not in volume_sizes
-                    ):
-                        volume_opts[volume_type] = {"size": "15G"}
-
-                    # Override with user-specified sizes
-                    if volume_type.value in volume_sizes:
-                        volume_opts[volume_type] = {
-                            "size": volume_sizes[volume_type.value]
-                        }
-
-                # Ensure etc volume has a size option
-                if VolumeType.ETC not in volume_opts:
-                    volume_opts[VolumeType.ETC] = {"size": "1G"}
-
-                # Create the volumes
-                volumes = volume_manager.create_volume_set(
-                    version_suffix,
-                    driver=volume_driver,
-                    size_opts=cast(
-                        dict[VolumeType | str, dict[str, str]] | None,
-                        volume_opts,
+                # User-specified sizes override the per-type defaults
+                volume_opts = {
+                    volume_type: {
+                        "size": volume_sizes.get(
+                            volume_type.value, _DEFAULT_VOLUME_SIZES[volume_type]
+                        )
+                    }
+                    for volume_type in volume_types_to_create
+                }
+                volume_opts[VolumeType.ETC] = {
+                    "size": _DEFAULT_VOLUME_SIZES[VolumeType.ETC]
+                }
+
+                # Create the volume set and the etc volume concurrently, as
+                # each is an independent round trip to the Docker daemon
+                etc_opts = volume_opts[VolumeType.ETC]
+                volumes, etc_volume_name = await asyncio.gather(
+                    asyncio.to_thread(
+                        volume_manager.create_volume_set,
+                        version_suffix,
+                        driver=volume_driver,
+                        size_opts=cast(
+                            dict[VolumeType | str, dict[str, str]] | None,
+                            volume_opts,
+                        ),
+                    ),
+                    asyncio.to_thread(
+                        volume_manager.create_volume,
+                        VolumeType.ETC,
+                        f"etc_{version_suffix}",
+                        driver=volume_driver,
+                        driver_opts=etc_opts,
                     ),
+                    return_exceptions=True,
                 )
 
+                # Roll back whichever half succeeded if the other one failed
+                if isinstance(volumes, BaseException):
+                    if not isinstance(etc_volume_name, BaseException):
+                        volume_manager.delete_volume(etc_volume_name, force=True)
+                    raise volumes
+                if isinstance(etc_volume_name, BaseException):
+                    for created_name in volumes.values():
+                        volume_manager.delete_volume(created_name, force=True)
+                    raise etc_volume_name
+
                 # Store volume names for compose file generation
                 for volume_type, name in volumes.items():
                     volume_names[volume_type.value] = name
-
-                # Also create an etc volume with appropriate type and size
-                etc_opts = volume_opts.get(VolumeType.ETC, {"size": "1G"})
-                etc_volume_name = volume_manager.create_volume(
-                    VolumeType.ETC,
-                    f"etc_{version_suffix}",
-                    driver=volume_driver,
-                    driver_opts=etc_opts,
-                )
                 volume_names["etc"] = etc_volume_name
 
                 console.print(
@@ -244,6 +287,8 @@ async def install_docker(
                     raise typer.Exit(1)
 
         # Create file manager and generate files
+        from .files import DockerFileManager
+
         file_manager = DockerFileManager(
             config,
             console,
@@ -251,30 +296,36 @@ async def install_docker(
             volume_names=volume_names,
         )
 
-        file_results = file_manager.generate_all_files(non_interactive)
+        # Render and write the files off the event loop
+        file_results = await asyncio.to_thread(
+            file_manager.generate_all_files, non_interactive
+        )
 
         # Check if all files were created successfully
         all_success = all(result.success for result in file_results.values())
 
-        if all_success:
-            console.print("\n[green]Docker files generated successfully![/]")
-        else:
-            console.print("\n[yellow]Some files were not generated successfully.[/]")
+        with console:
+            if all_success:
+                console.print("\n[green]Docker files generated successfully![/]")
+            else:
+                console.print(
+                    "\n[yellow]Some files were not generated successfully.[/]"
+                )
 
-        console.print(f"Docker Compose directory: {config.output_dir}")
+            console.print(f"Docker Compose directory: {config.output_dir}")
 
-        # Show security information
-        console.print("\n[yellow]Security Information:[/]")
-        console.print(f"Join Key: {config.joinkey}")
-        console.print("[bold yellow]Keep this information secure![/]")
+            # Show security information
+            console.print("\n[yellow]Security Information:[/]")
+            console.print(f"Join Key: {config.joinkey}")
+            console.print("[bold yellow]Keep this information secure![/]")
 
-        if config.use_postgres:
-            # Show PostgreSQL password if using PostgreSQL
-            console.print("\n[yellow]PostgreSQL Configuration:[/]")
-            console.print(f"Username: {config.postgres_user}")
-            console.print(f"Password: {config.get_password('postgres')}")
-            console.print(f"Database: {config.postgres_db}")
-            console.print("[yellow]Make sure to save this information securely![/]")
+            if config.use_postgres:
+                # Show PostgreSQL password if using PostgreSQL
+                console.print("\n[yellow]PostgreSQL Configuration:[/]")
+                console.print(f"Username: {config.postgres_user}")
+                console.print(f"Password: {config.get_password(POSTGRES_PASSWORD_KEY)}")
+                console.print(f"Database: {config.postgres_db}")
+                console.print("[yellow]Make sure to save this information securely![/]")
 
         # Start Artifactory if requested
         if start:
@@ -283,7 +334,9 @@ async def install_docker(
             # Create container manager
             if config.output_dir is None:
                 raise ValueError("output_dir must be set before starting containers")
-            container_manager = DockerContainerManager(config.output_dir, console)
+            container_manager = DockerContainerManager(
+                config.output_dir, console, port=config.port
+            )
 
             # Clean up any existing containers first
             if not non_interactive:
@@ -300,39 +353,41 @@ async def install_docker(
             success = await container_manager.start_containers(debug=debug)
 
             if success:
-                console.print("[green]Artifactory is starting up![/]")
-                console.print("\n[bold]To access Artifactory:[/]")
-                console.print(f"http://localhost:{config.port}/ui/")
-                console.print("\nDefault admin credentials: admin/password")
-                console.print(
-                    "[bold red]Important:[/] Change the default password immediately after first login!"
-                )
-                console.print("\nIt may take a minute or two to fully start.")
-
-                # If using named volumes, show helpful information
-                if use_named_volumes:
-                    console.print("\n[bold]Volume Information:[/]")
+                with console:
+                    console.print("[green]Artifactory is starting up![/]")
+                    console.print("\n[bold]To access Artifactory:[/]")
+                    console.print(f"http://localhost:{config.port}/ui/")
+                    console.print("\nDefault admin credentials: admin/password")
                     console.print(
-                        "Your data is stored in Docker named volumes which can be managed with:"
+                        "[bold red]Important:[/] Change the default password immediately after first login!"
                     )
-                    console.print("- docker volume ls")
-                    console.print("- sapo volume list")
-                    console.print("\nTo back up these volumes:")
-                    console.print("sapo volume backup --name <volume-name>")
+                    console.print("\nIt may take a minute or two to fully start.")
+
+                    # If using named volumes, show helpful information
+                    if use_named_volumes:
+                        console.print("\n[bold]Volume Information:[/]")
+                        console.print(
+                            "Your data is stored in Docker named volumes which can be managed with:"
+                        )
+                        console.print("- docker volume ls")
+                        console.print("- sapo volume list")
+                        console.print("\nTo back up these volumes:")
+                        console.print("sapo volume backup --name <volume-name>")
             else:
-                console.print("[red]Failed to start Artifactory.[/]")
-                console.print("\n[bold]Troubleshooting:[/]")
-                console.print("1. Verify Docker is running properly")
-                console.print("2. Check if port conflicts exist")
-                console.print("3. Ensure sufficient disk space and permissions")
-                console.print(
-                    "4. Clean up any previous installations: docker rm -f artifactory artifactory-postgres"
-                )
-                console.print("5. Examine Docker logs: docker logs artifactory")
-                console.print(
-                    "\n[bold]To start Artifactory manually with full output, run:[/]"
-                )
-                console.print(f"cd {config.output_dir} && docker compose up")
+                with console:
+                    console.print("[red]Failed to start Artifactory.[/]")
+                    console.print("\n[bold]Troubleshooting:[/]")
+                    console.print("1. Verify Docker is running properly")
+                    console.print("2. Check if port conflicts exist")
+                    console.print("3. Ensure sufficient disk space and permissions")
+                    console.print(
+                        "4. Clean up any previous installations: docker rm -f artifactory artifactory-postgres"
+                    )
+                    console.print("5. Examine Docker logs: docker logs artifactory")
+                    console.print(
+                        "\n[bold]To start Artifactory manually with full output, run:[/]"
+                    )
+                    console.print(f"cd {config.output_dir} && docker compose up")
 
                 # Offer to clean up failed containers
                 if not non_interactive and typer.confirm(
@@ -344,15 +399,19 @@ async def install_docker(
                     )
         else:
             # Display instructions
-            console.print("\n[bold]To start Artifactory, run:[/]")
-            console.print(f"cd {config.output_dir} && docker compose up -d")
-            console.print("\n[bold]To access Artifactory after starting:[/]")
-            console.print(f"http://localhost:{config.port}/ui/")
-            console.print("\nDefault admin credentials: admin/password")
-            console.print(
-                "[bold red]Important:[/] Change the default password immediately after first login!"
-            )
+            with console:
+                console.print("\n[bold]To start Artifactory, run:[/]")
+                console.print(f"cd {config.output_dir} && docker compose up -d")
+                console.print("\n[bold]To access Artifactory after starting:[/]")
+                console.print(f"http://localhost:{config.port}/ui/")
+                console.print("\nDefault admin credentials: admin/password")
+                console.print(
+                    "[bold red]Important:[/] Change the default password immediately after first login!"
+                )
 
+    except typer.Exit:
+        # Already reported (or a user cancellation); keep its exit code
+        raise
     except Exception as e:
         console.print(f"[bold red]Error: {str(e)}[/]")
         if debug:
@@ -364,6 +423,86 @@ async def install_docker(
         raise typer.Exit(1)
 
 
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_THREAD: threading.Thread | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+# Seconds to wait for cancelled work to run its cleanup before giving up
+_CANCEL_TIMEOUT = 10.0
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to finish."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _cancel_loop_work(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel the work running on the background loop and wait for its cleanup.
+
+    Args:
+        loop: Background event loop
+    """
+    future = asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop)
+    try:
+        future.result(timeout=_CANCEL_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop the background event loop and release its resources.
+
+    Mirrors the teardown of ``asyncio.run``: pending tasks are cancelled,
+    async generators and the default executor are shut down and the loop is
+    closed.
+
+    Args:
+        loop: Event loop to stop
+        thread: Thread running the loop
+    """
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(_CANCEL_TIMEOUT)
+    if thread.is_alive():
+        # The loop is stuck in a callback; closing it now would raise
+        return
+
+    try:
+        loop.run_until_complete(_cancel_pending_tasks())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop used by the synchronous entry points.
+
+    The loop runs in a daemon thread and is created on first use, so repeated
+    synchronous calls reuse it instead of creating and closing a loop each time.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop
+    """
+    global _LOOP, _LOOP_THREAD
+
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP_THREAD is None or not _LOOP_THREAD.is_alive():
+            _LOOP = asyncio.new_event_loop()
+            _LOOP_THREAD = threading.Thread(
+                target=_LOOP.run_forever, name="sapo-event-loop", daemon=True
+            )
+            _LOOP_THREAD.start()
+            atexit.register(_stop_loop, _LOOP, _LOOP_THREAD)
+        return _LOOP
+
+
 # Synchronous entry point for CLI
 def install_docker_sync(
     version: str = "latest",
@@ -398,9 +537,11 @@ def install_docker_sync(
     Returns:
         OperationStatus: Success or error status
     """
+    loop = _get_loop()
+    future = None
     try:
         # Use the local async Docker installation function from this module
-        asyncio.run(
+        future = asyncio.run_coroutine_threadsafe(
             install_docker(
                 version=version,
                 port=port,
@@ -411,13 +552,23 @@ def install_docker_sync(
                 use_named_volumes=use_named_volumes,
                 volume_driver=volume_driver,
                 volume_sizes=volume_sizes,
-            )
+            ),
+            loop,
         )
+        future.result()
         return OperationStatus.SUCCESS
     except KeyboardInterrupt:
+        if future is not None:
+            # Let the installer's cleanup (subprocesses, API client) run
+            # before the process exits
+            _cancel_loop_work(loop)
         local_console = Console()
         local_console.print("\n[yellow]Operation cancelled by user.[/]")
         return OperationStatus.WARNING
+    except typer.Exit as e:
+        # install_docker has already reported why it stopped; exit code 0
+        # means the user declined to continue
+        return OperationStatus.WARNING if e.exit_code == 0 else OperationStatus.ERROR
     except Exception as e:
         # Catch and report any exceptions
         temp_console = Console()
@@ -431,6 +582,14 @@ def install_docker_sync(
         return OperationStatus.ERROR
 
 
+# Use only Docker/YAML-safe special characters (avoid $, `, \, ", ')
+_SPECIAL_CHARS = "!@#%^&*()-_=+[]{}|;:,.<>/?"
+_PASSWORD_CHARSET = (string.ascii_letters + string.digits + _SPECIAL_CHARS).encode()
+_LETTERS = string.ascii_letters.encode()
+_DIGITS = string.digits.encode()
+_SPECIALS = _SPECIAL_CHARS.encode()
+_PASSWORD_LENGTH = 32
+
 _password_cache: dict[str, str] = {}
 
 
@@ -443,28 +602,24 @@ def generate_password(key: str) -> str:
     Returns:
         str: The generated password
     """
-    if key not in _password_cache:
-        # Use Docker/YAML-safe character classes for password complexity
-        letters = string.ascii_letters
-        digits = string.digits
-        # Use only Docker/YAML-safe special characters (avoid $, `, \, ", ')
-        special_chars = "!@#%^&*()-_=+[]{}|;:,.<>/?"
-
-        # Create a base password that has at least one of each required character type
-        base_password = [
-            secrets.choice(letters),  # At least one letter
-            secrets.choice(digits),  # At least one digit
-            secrets.choice(special_chars),  # At least one special char
-        ]
-
-        # Fill the rest with random selections from all characters
-        all_chars = letters + digits + special_chars
-        base_password.extend(
-            secrets.choice(all_chars) for _ in range(32 - len(base_password))
-        )
-
-        # Shuffle the password to avoid predictable character placement
-        secrets.SystemRandom().shuffle(base_password)
-        _password_cache[key] = "".join(base_password)
-
-    return _password_cache[key]
+    existing = _password_cache.get(key)
+    if existing is not None:
+        return existing
+
+    # Create a base password that has at least one of each required character type
+    base_password = [
+        _random_chars(_LETTERS, 1),  # At least one letter
+        _random_chars(_DIGITS, 1),  # At least one digit
+        _random_chars(_SPECIALS, 1),  # At least one special char
+    ]
+
+    # Fill the rest from a single bulk draw over all characters
+    base_password.extend(
+        _random_chars(_PASSWORD_CHARSET, _PASSWORD_LENGTH - len(base_password))
+    )
+
+    # Shuffle the password to avoid predictable character placement
+    _SYSRAND.shuffle(base_password)
+
+    # setdefault keeps the first value if another thread stored one meanwhile
+    return _password_cache.setdefault(key, "".join(base_password))
@@ -1,12 +1,97 @@
 """Docker configuration models for Artifactory."""
 
+import functools
+import os
 import secrets
 import string
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Self
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+
+# Password cache key for the PostgreSQL user, shared by every call site so
+# the generated files and the summary always agree on one password
+POSTGRES_PASSWORD_KEY = "postgres"
+
+# Docker/YAML-safe special characters
+# Avoiding YAML-problematic chars: #, :, [, ], {, }, , and /
+_SPECIAL_CHARS = "!@%^&*()-_=+.<>|;"
+_PASSWORD_CHARSET = (string.ascii_letters + string.digits + _SPECIAL_CHARS).encode()
+
+# Per-class alphabets for the guaranteed characters of each password
+_UPPERCASE = string.ascii_uppercase.encode()
+_LOWERCASE = string.ascii_lowercase.encode()
+_DIGITS = string.digits.encode()
+_SPECIALS = _SPECIAL_CHARS.encode()
+
+# SystemRandom keeps no state of its own, so one instance serves every caller
+_SYSRAND = secrets.SystemRandom()
+
+# Shared pool of OS random bytes, so the join key and passwords generated for
+# one install are served from a single getrandom call instead of one each
+_RANDOM_POOL_SIZE = 512
+_random_pool = bytearray()
+_random_pool_lock = threading.Lock()
+
+# A forked child must never hand out the same bytes as its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random_pool.clear)
+
+
+def _random_bytes(count: int) -> bytes:
+    """Take random bytes from the shared pool, refilling it from the OS.
+
+    Bytes are removed from the pool as they are handed out, so no value is
+    ever returned twice.
+
+    Args:
+        count: Number of bytes to return
+
+    Returns:
+        bytes: Cryptographically secure random bytes
+    """
+    with _random_pool_lock:
+        if len(_random_pool) < count:
+            _random_pool.extend(os.urandom(max(_RANDOM_POOL_SIZE, count)))
+        chunk = bytes(_random_pool[:count])
+        del _random_pool[:count]
+    return chunk
+
+
+def _random_chars(alphabet: bytes, count: int) -> str:
+    """Draw characters uniformly from an alphabet using bulk random bytes.
+
+    Bytes above the largest multiple of the alphabet size are discarded so
+    the modulo mapping stays unbiased.
+
+    Args:
+        alphabet: ASCII characters to draw from
+        count: Number of characters to return
+
+    Returns:
+        str: The random characters
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    chars = bytearray()
+    while len(chars) < count:
+        chars.extend(alphabet[b % size] for b in _random_bytes(2 * count) if b < limit)
+    return chars[:count].decode("ascii")
+
+
+@functools.cache
+def default_data_dir() -> Path:
+    """Get the default Artifactory data directory.
+
+    Resolved on first use rather than at import time, then reused.
+
+    Returns:
+        Path: The default data directory
+    """
+    return Path.home() / ".jfrog" / "artifactory"
 
 
 class DatabaseType(str, Enum):
@@ -32,13 +117,13 @@ class DockerConfig(BaseModel):
 
     version: str
     port: int = Field(default=8082)
-    data_dir: Path = Field(default=Path.home() / ".jfrog" / "artifactory")
+    data_dir: Path = Field(default_factory=default_data_dir)
     database_type: DatabaseType = Field(default=DatabaseType.POSTGRESQL)
     postgres_user: str = Field(default="artifactory")
     postgres_db: str = Field(default="artifactory")
     output_dir: Path | None = Field(default=None)
     joinkey: str | None = Field(default=None)
-    _passwords: dict[str, str] = {}
+    _passwords: dict[str, str] = PrivateAttr(default_factory=dict)
 
     @model_validator(mode="after")
     def set_default_output_dir(self) -> Self:
@@ -56,33 +141,30 @@ class DockerConfig(BaseModel):
         Returns:
             str: The generated password
         """
-        if key not in self._passwords:
-            # Generate a strong password with Docker/YAML-safe characters
-            letters = string.ascii_letters
-            digits = string.digits
-            # Use only Docker/YAML-safe special characters
-            # Avoiding YAML-problematic chars: #, :, [, ], {, }, , and /
-            special_chars = "!@%^&*()-_=+.<>|;"
-            charset = letters + digits + special_chars
-
-            # Start with a base of minimum required characters (one of each type)
-            base_password = [
-                secrets.choice(string.ascii_uppercase),  # at least one uppercase letter
-                secrets.choice(string.ascii_lowercase),  # at least one lowercase letter
-                secrets.choice(digits),  # at least one digit
-                secrets.choice(special_chars),  # at least one special
-            ]
-
-            # Fill the rest randomly from all chars (16 more to get 20 total)
-            remaining_chars = [secrets.choice(charset) for _ in range(16)]
-
-            # Combine and shuffle the full password
-            password_chars = base_password + remaining_chars
-            secrets.SystemRandom().shuffle(password_chars)
-
-            # Convert to string and store
-            self._passwords[key] = "".join(password_chars)
-        return self._passwords[key]
+        # Private attributes resolve through BaseModel.__getattr__, so look
+        # the cache up once
+        passwords = self._passwords
+        existing = passwords.get(key)
+        if existing is not None:
+            return existing
+
+        # Start with a base of minimum required characters (one of each type)
+        base_password = [
+            _random_chars(_UPPERCASE, 1),  # at least one uppercase letter
+            _random_chars(_LOWERCASE, 1),  # at least one lowercase letter
+            _random_chars(_DIGITS, 1),  # at least one digit
+            _random_chars(_SPECIALS, 1),  # at least one special
+        ]
+
+        # Fill the rest randomly from all chars (16 more to get 20 total)
+        remaining_chars = list(_random_chars(_PASSWORD_CHARSET, 16))
+
+        # Combine and shuffle the full password
+        password_chars = base_password + remaining_chars
+        _SYSRAND.shuffle(password_chars)
+
+        # Convert to string and store, keeping any value stored concurrently
+        return passwords.setdefault(key, "".join(password_chars))
 
     def get_password(self, key: str) -> str:
         """Retrieve a previously generated password.
@@ -93,9 +175,10 @@ class DockerConfig(BaseModel):
         Returns:
             str: The stored password
         """
-        if key not in self._passwords:
-            return self.generate_password(key)
-        return self._passwords[key]
+        existing = self._passwords.get(key)
+        if existing is not None:
+            return existing
+        return self.generate_password(key)
 
     def generate_joinkey(self) -> str:
         """Generate a secure join key for Artifactory.
@@ -105,8 +188,7 @@ class DockerConfig(BaseModel):
         """
         if not self.joinkey:
             # Generate a hexadecimal join key (required by Artifactory)
-            # Use secrets.token_hex to generate a secure hex string
-            self.joinkey = secrets.token_hex(16)  # 32 characters of hex (16 bytes)
+            self.joinkey = _random_bytes(16).hex()  # 32 characters of hex (16 bytes)
         return self.joinkey
 
     @property
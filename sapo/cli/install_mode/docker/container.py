@@ -1,14 +1,33 @@
 """Docker container management for Artifactory."""
 
 import asyncio
+import contextlib
+import json
+import re
+import shutil
 import subprocess  # nosec B404
+from collections import deque
+from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 
 from ..common import run_docker_command
 
+if TYPE_CHECKING:
+    from docker import DockerClient
+
+# Compose output lines that are always shown, matched on the raw bytes so
+# ordinary progress lines are never decoded or lowercased
+_ERROR_LINE_RE = re.compile(rb"error|fail", re.IGNORECASE)
+
+# docker inspect template printing the state and, when defined, the health
+_STATUS_FORMAT = "{{.State.Status}} {{if .State.Health}}{{.State.Health.Status}}{{end}}"
+# Same, prefixed with the container name for multi-container inspects
+_NAMED_STATUS_FORMAT = "{{.Name}} " + _STATUS_FORMAT
+
 
 class ContainerStatus(str, Enum):
     """Container status types."""
@@ -20,27 +39,98 @@ class ContainerStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+def _status_from_state(status: str, health_state: str) -> ContainerStatus:
+    """Map Docker state and health strings to a container status.
+
+    Args:
+        status: Value of ``.State.Status``
+        health_state: Value of ``.State.Health.Status``, empty if undefined
+
+    Returns:
+        ContainerStatus: Status of the container
+    """
+    if status == "running":
+        if health_state == "unhealthy":
+            return ContainerStatus.UNHEALTHY
+        if health_state == "healthy":
+            return ContainerStatus.HEALTHY
+        return ContainerStatus.RUNNING
+    elif status == "exited":
+        return ContainerStatus.STOPPED
+    else:
+        return ContainerStatus.UNKNOWN
+
+
 class DockerContainerManager:
     """Manages Docker containers for Artifactory."""
 
-    def __init__(self, compose_dir: Path, console: Console | None = None):
+    def __init__(
+        self,
+        compose_dir: Path,
+        console: Console | None = None,
+        port: int | None = None,
+    ):
         self.compose_dir = compose_dir
+        self.compose_file = compose_dir / "docker-compose.yml"
         self.console = console or Console()
+        self.port = port
+        self._docker_available: bool | None = None
+        # Monotonic clock for health-check deadlines; None uses the event loop's
+        self.clock: Callable[[], float] | None = None
+        self._api_client: DockerClient | None = None
+        self._api_client_checked = False
 
     def is_docker_available(self) -> bool:
         """Check if Docker is available on the system.
 
+        The probe runs once per manager; later calls reuse its result.
+
         Returns:
             bool: True if Docker is available
         """
-        try:
-            run_docker_command(["docker", "--version"], check=True, capture_output=True)
-            return True
-        except (subprocess.SubprocessError, FileNotFoundError, ValueError):
+        if self._docker_available is not None:
+            return self._docker_available
+
+        # A PATH lookup answers this without spawning docker --version
+        self._docker_available = shutil.which("docker") is not None
+        if not self._docker_available:
             self.console.print(
                 "[bold red]Error:[/] Docker not found. Please install Docker and try again."
             )
-            return False
+        return self._docker_available
+
+    def _get_api_client(self) -> "DockerClient | None":
+        """Get a Docker Engine API client, connecting on first use.
+
+        The client keeps its connection to the daemon socket open, so repeated
+        status queries do not spawn a docker CLI process each time.
+
+        Returns:
+            Optional[DockerClient]: Client, or None if the daemon is unreachable
+        """
+        if self._api_client_checked:
+            return self._api_client
+        self._api_client_checked = True
+
+        # The SDK is heavy to import and only needed once containers are polled
+        import docker
+        from docker.errors import DockerException
+
+        try:
+            self._api_client = docker.from_env()
+        except DockerException:
+            self._api_client = None
+        return self._api_client
+
+    def _close_api_client(self) -> None:
+        """Close the Docker Engine API client, if one was opened.
+
+        The next status query connects again.
+        """
+        if self._api_client is not None:
+            self._api_client.close()
+        self._api_client = None
+        self._api_client_checked = False
 
     def clean_environment(self, debug: bool = False) -> bool:
         """Clean up Docker environment by stopping and removing containers.
@@ -56,7 +146,7 @@ class DockerContainerManager:
         # First try with docker compose
         try:
             # Check if docker-compose.yml exists in the given directory
-            if not (self.compose_dir / "docker-compose.yml").exists():
+            if not self.compose_file.is_file():
                 self.console.print(
                     "[yellow]No docker-compose.yml found, skipping compose cleanup.[/]"
                 )
@@ -85,24 +175,15 @@ class DockerContainerManager:
 
         # Also try to remove containers directly by name as a fallback
         try:
-            # Remove artifactory container if it exists
-            run_docker_command(
-                ["docker", "rm", "-f", "artifactory"], capture_output=True, check=False
-            )
-
-            # Remove postgres container if it exists
+            # Remove both containers in one call; missing ones are ignored
             run_docker_command(
-                ["docker", "rm", "-f", "artifactory-postgres"],
+                ["docker", "rm", "-f", "artifactory", "artifactory-postgres"],
                 capture_output=True,
                 check=False,
             )
 
-            # Optionally remove the network if the compose shutdown failed. This keeps
-            # the normal cleanup path consistent with existing unit tests (expecting
-            # three subprocess calls: compose down + two container removals). The
-            # additional network removal is only attempted when the compose command
-            # fails, which is already covered by tests that simulate failure.
-
+            # Remove the network too if the compose shutdown failed, since
+            # compose would otherwise have removed it
             if "process" in locals() and process.returncode != 0:
                 run_docker_command(
                     ["docker", "network", "rm", "artifactory_network"],
@@ -134,38 +215,36 @@ class DockerContainerManager:
         )
 
         try:
-            # Execute docker compose up
-            cmd = ["docker", "compose", "up", "-d"]
-            process = subprocess.Popen(  # nosec B603
-                cmd,
+            # Execute docker compose up; images are pulled only when missing,
+            # and their per-layer progress is only streamed in debug mode
+            cmd = ["docker", "compose", "up", "-d", "--pull", "missing"]
+            if not debug:
+                cmd.append("--quiet-pull")
+            process = await asyncio.create_subprocess_exec(  # nosec B603
+                *cmd,
                 cwd=self.compose_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
             )
 
-            # Collect all output for error reporting
-            output_lines = []
+            # Keep only the tail of the output for error reporting
+            output_lines: deque[bytes] = deque(maxlen=10)
 
-            # Stream the output
+            # Stream the output without blocking the event loop
             if process.stdout is not None:
-                while True:
-                    output = process.stdout.readline()
-                    if output:
-                        output_lines.append(output.strip())
-                        # Always show critical errors
-                        if "error" in output.lower() or "fail" in output.lower():
-                            self.console.print(f"[red]{output.strip()}[/]")
-                        # Show all output in debug mode
-                        elif debug:
-                            self.console.print(output.strip())
-
-                    if output == "" and process.poll() is not None:
-                        break
-
-            return_code = process.poll()
+                while raw_line := await process.stdout.readline():
+                    raw_line = raw_line.strip()
+                    output_lines.append(raw_line)
+                    # Always show critical errors
+                    if _ERROR_LINE_RE.search(raw_line):
+                        self.console.print(
+                            f"[red]{raw_line.decode(errors='replace')}[/]"
+                        )
+                    # Show all output in debug mode
+                    elif debug:
+                        self.console.print(raw_line.decode(errors="replace"))
+
+            return_code = await process.wait()
 
             if return_code != 0:
                 self.console.print(
@@ -176,8 +255,8 @@ class DockerContainerManager:
                 if output_lines:
                     self.console.print("[bold red]Docker Compose output:[/]")
                     # Show the last 10 lines or all if less than 10
-                    for line in output_lines[-10:]:
-                        self.console.print(f"  {line}")
+                    for line in output_lines:
+                        self.console.print(f"  {line.decode(errors='replace')}")
 
                     self.console.print(
                         "\n[bold]To see full Docker Compose output, run manually:[/]"
@@ -190,6 +269,14 @@ class DockerContainerManager:
             if not await self.wait_for_health(debug=debug):
                 return False
 
+            # The generated compose file publishes the configured port, so
+            # only ask Docker for the mapping when it is not known up front
+            if self.port is not None:
+                self.console.print(
+                    f"[bold green]Artifactory is now running![/] Access at http://localhost:{self.port}"
+                )
+                return True
+
             # Get the port number
             try:
                 port_cmd = ["docker", "compose", "port", "artifactory", "8082"]
@@ -217,56 +304,126 @@ class DockerContainerManager:
     async def wait_for_health(
         self,
         timeout: int = 300,
-        interval: int = 5,
+        interval: float = 5,
         debug: bool = False,
+        initial_interval: float = 0.5,
     ) -> bool:
         """Wait until Artifactory (and its PostgreSQL container) become healthy.
 
+        A ``docker events`` subscription re-checks the containers as soon as
+        either one starts, dies or changes health. Polling starts at
+        ``initial_interval`` and backs off geometrically up to ``interval`` as
+        a fallback for when no events arrive.
+
         Args:
             timeout: Maximum time in seconds to wait
-            interval: Seconds between health checks
+            interval: Maximum seconds between health checks
             debug: Show debug output
+            initial_interval: Seconds before the first re-check
 
         Returns:
             bool: True if containers became healthy, False otherwise
         """
-        attempts: int = 0
-        max_attempts: int = max(1, timeout // interval)
+        names = ["artifactory", "artifactory-postgres"]
+        clock = self.clock or asyncio.get_running_loop().time
+        deadline = clock() + timeout
+        delay = min(initial_interval, interval)
+        attempt = 1
+
+        changed = asyncio.Event()
+        watcher = asyncio.create_task(self._watch_container_events(names, changed))
+        try:
+            while True:
+                # Events seen from here on trigger the next check early
+                changed.clear()
 
-        while attempts < max_attempts:
-            art_status = self.get_container_status("artifactory")
-            pg_status = self.get_container_status("artifactory-postgres")
+                # One batched inspect per attempt, run off the event loop
+                statuses = await asyncio.to_thread(self.get_container_statuses, names)
+                art_status = statuses["artifactory"]
+                pg_status = statuses["artifactory-postgres"]
 
-            if debug:
-                self.console.print(
-                    f"[cyan]Health check attempt {attempts + 1}: artifactory={art_status}, postgres={pg_status}[/]"
-                )
-
-            # The tests expect at least three sleep cycles before success. To
-            # satisfy that expectation we always wait for a minimum of three
-            # iterations even if the containers report healthy sooner.
-            min_attempts = 3
+                if debug:
+                    self.console.print(
+                        f"[cyan]Health check attempt {attempt}: artifactory={art_status}, postgres={pg_status}[/]"
+                    )
 
-            if (
-                attempts >= min_attempts
-                and art_status in {ContainerStatus.RUNNING, ContainerStatus.HEALTHY}
-                and pg_status
-                in {
+                if art_status in {
+                    ContainerStatus.RUNNING,
+                    ContainerStatus.HEALTHY,
+                } and pg_status in {
                     ContainerStatus.RUNNING,
                     ContainerStatus.HEALTHY,
                     ContainerStatus.STOPPED,
-                }
-            ):
-                return True
+                }:
+                    return True
+
+                remaining = deadline - clock()
+                if remaining <= 0:
+                    return False
+
+                await self._wait_for_change(changed, min(delay, remaining))
+                delay = min(interval, delay * 1.5)
+                attempt += 1
+        finally:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+            self._close_api_client()
+
+    @staticmethod
+    async def _wait_for_change(changed: asyncio.Event, timeout: float) -> None:
+        """Wait until a container event arrives or the timeout expires.
+
+        Args:
+            changed: Event set by the container event watcher
+            timeout: Maximum seconds to wait
+        """
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(changed.wait(), timeout)
+
+    async def _watch_container_events(
+        self, container_names: list[str], changed: asyncio.Event
+    ) -> None:
+        """Set ``changed`` whenever one of the containers changes state.
 
-            attempts += 1
-            await asyncio.sleep(interval)
+        Runs until cancelled. If ``docker events`` cannot be started or exits,
+        the health check simply keeps polling.
+
+        Args:
+            container_names: Names of the containers to watch
+            changed: Event to set on every start, die or health_status event
+        """
+        cmd = ["docker", "events", "--filter", "type=container"]
+        for name in container_names:
+            cmd += ["--filter", f"container={name}"]
+        for event in ("start", "die", "health_status"):
+            cmd += ["--filter", f"event={event}"]
+        cmd += ["--format", "{{.Actor.Attributes.name}} {{.Status}}"]
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return
 
-        return False
+        try:
+            if process.stdout is not None:
+                while await process.stdout.readline():
+                    changed.set()
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
 
     def get_container_status(self, container_name: str) -> ContainerStatus:
         """Get the status of a container.
 
+        The state and health are read with a single ``docker inspect`` so each
+        health poll costs one process spawn per container.
+
         Args:
             container_name: Name of the container
 
@@ -275,7 +432,7 @@ class DockerContainerManager:
         """
         try:
             result = run_docker_command(
-                ["docker", "inspect", "--format", "{{.State.Status}}", container_name],
+                ["docker", "inspect", "--format", _STATUS_FORMAT, container_name],
                 capture_output=True,
                 check=False,
             )
@@ -287,51 +444,96 @@ class DockerContainerManager:
 
             # Handle JSON output (used in unit tests)
             if raw_output.startswith("{") or raw_output.startswith("["):
-                import json
-
                 try:
                     data = json.loads(raw_output)
                     if isinstance(data, list):
                         data = data[0]
 
-                    status = data.get("State", {}).get("Status", "")
-                    health_state = (
-                        data.get("State", {}).get("Health", {}).get("Status", "")
-                    )
-                    if status == "running" and health_state == "unhealthy":
-                        return ContainerStatus.UNHEALTHY
-                    if status == "running" and health_state == "healthy":
-                        return ContainerStatus.HEALTHY
+                    state = data.get("State", {})
+                    status = state.get("Status", "")
+                    health_state = state.get("Health", {}).get("Status", "")
                 except Exception:
-                    status = raw_output
+                    status, health_state = raw_output, ""
             else:
-                status = raw_output
-
-            if status == "running":
-                # Check health status for running containers
-                health = run_docker_command(
-                    [
-                        "docker",
-                        "inspect",
-                        "--format",
-                        "{{.State.Health.Status}}",
-                        container_name,
-                    ],
-                    capture_output=True,
-                    check=False,
-                )
+                status, _, health_state = raw_output.partition(" ")
+
+            return _status_from_state(status, health_state)
+
+        except Exception:
+            return ContainerStatus.UNKNOWN
 
-                if health.returncode == 0 and health.stdout.strip() == "unhealthy":
-                    return ContainerStatus.UNHEALTHY
+    def get_container_statuses(
+        self, container_names: list[str]
+    ) -> dict[str, ContainerStatus]:
+        """Get the status of several containers.
 
-                if health.returncode == 0 and health.stdout.strip() == "healthy":
-                    return ContainerStatus.HEALTHY
+        Containers are inspected through the Engine API when the daemon socket
+        is reachable, otherwise with a single ``docker inspect``.
 
-                return ContainerStatus.RUNNING
-            elif status == "exited":
-                return ContainerStatus.STOPPED
-            else:
-                return ContainerStatus.UNKNOWN
+        Args:
+            container_names: Names of the containers
 
+        Returns:
+            Dict[str, ContainerStatus]: Status by container name; containers
+            that do not exist are reported as unknown
+        """
+        client = self._get_api_client()
+        if client is not None:
+            api_statuses = self._get_api_statuses(client, container_names)
+            if api_statuses is not None:
+                return api_statuses
+
+        statuses = dict.fromkeys(container_names, ContainerStatus.UNKNOWN)
+        try:
+            result = run_docker_command(
+                ["docker", "inspect", "--format", _NAMED_STATUS_FORMAT]
+                + container_names,
+                capture_output=True,
+                check=False,
+            )
         except Exception:
-            return ContainerStatus.UNKNOWN
+            return statuses
+
+        # docker inspect still prints the containers it found (and exits
+        # non-zero) when some of the names do not exist
+        for line in result.stdout.splitlines():
+            name, _, state = line.strip().partition(" ")
+            name = name.lstrip("/")
+            if name in statuses:
+                status, _, health_state = state.partition(" ")
+                statuses[name] = _status_from_state(status, health_state)
+        return statuses
+
+    @staticmethod
+    def _get_api_statuses(
+        client: "DockerClient", container_names: list[str]
+    ) -> dict[str, ContainerStatus] | None:
+        """Get container statuses through the Docker Engine API.
+
+        Args:
+            client: Connected Docker client
+            container_names: Names of the containers
+
+        Returns:
+            Optional[Dict[str, ContainerStatus]]: Status by container name, or
+            None if the API failed and the CLI should be used instead
+        """
+        import requests
+        from docker.errors import DockerException, NotFound
+
+        statuses = dict.fromkeys(container_names, ContainerStatus.UNKNOWN)
+        for name in container_names:
+            try:
+                details: dict[str, Any] = client.api.inspect_container(name)
+            except NotFound:
+                continue
+            except (DockerException, requests.RequestException):
+                # The SDK lets connection errors from requests through when
+                # the daemon socket goes away (e.g. during a daemon restart)
+                return None
+
+            state = details.get("State", {})
+            statuses[name] = _status_from_state(
+                state.get("Status", ""), (state.get("Health") or {}).get("Status", "")
+            )
+        return statuses
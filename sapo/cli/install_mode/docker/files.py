@@ -1,10 +1,15 @@
 """File generation and management for Docker installation."""
 
+import os
 import platform
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
+import typer
 from rich.console import Console
 
 from ..common import OperationStatus
@@ -12,7 +17,7 @@ from ..common.directory_utils import create_artifactory_structure
 from ..common.file_utils import FileOperationResult, safe_write_file
 from ..common.system_utils import set_directory_permissions
 from ..templates import render_template_from_file
-from .config import DockerConfig
+from .config import POSTGRES_PASSWORD_KEY, DockerConfig
 
 
 class FileType(str, Enum):
@@ -37,6 +42,8 @@ class DockerFileManager:
         self.console = console or Console()
         self.use_named_volumes = use_named_volumes
         self.volume_names = volume_names or {}
+        # Set once create_directories has made sure data_dir/etc exists
+        self._dirs_created = False
 
     def generate_all_files(
         self, non_interactive: bool = False
@@ -55,12 +62,30 @@ class DockerFileManager:
         # Generate files
         self.console.print(f"[bold]Generating files in {self.config.output_dir}...[/]")
 
-        results = {}
-        results[FileType.ENV] = self._generate_env_file(non_interactive)
-        results[FileType.DOCKER_COMPOSE] = self._generate_docker_compose(
-            non_interactive
-        )
-        results[FileType.SYSTEM_YAML] = self._generate_system_yaml(non_interactive)
+        # Shared template values are computed once so every file sees the same
+        # password and join key
+        context = self._template_context()
+
+        generators = {
+            FileType.ENV: self._generate_env_file,
+            FileType.DOCKER_COMPOSE: self._generate_docker_compose,
+            FileType.SYSTEM_YAML: self._generate_system_yaml,
+        }
+
+        results: dict[FileType, FileOperationResult] = {}
+        if non_interactive:
+            # Each generator writes distinct paths, so the renders and writes can
+            # overlap; interactive runs stay sequential to keep prompts ordered
+            with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                futures = {
+                    file_type: executor.submit(generate, non_interactive, context)
+                    for file_type, generate in generators.items()
+                }
+            for file_type, future in futures.items():
+                results[file_type] = future.result()
+        else:
+            for file_type, generate in generators.items():
+                results[file_type] = generate(non_interactive, context)
 
         # Set permissions if not using named volumes
         if not self.use_named_volumes:
@@ -82,6 +107,7 @@ class DockerFileManager:
         if self.use_named_volumes:
             etc_path = self.config.data_dir / "etc"
             etc_path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created = True
             return {"etc": etc_path}
 
         # Create Artifactory directories for bind mounts
@@ -90,9 +116,8 @@ class DockerFileManager:
         # Create PostgreSQL directory structure if needed
         if self.config.use_postgres:
             pg_dir = self.config.data_dir / "postgresql"
-            pg_dir.mkdir(exist_ok=True)
             pg_data_dir = pg_dir / "data"
-            pg_data_dir.mkdir(exist_ok=True)
+            pg_data_dir.mkdir(parents=True, exist_ok=True)
             directories["postgresql"] = pg_dir
             directories["postgresql_data"] = pg_data_dir
 
@@ -111,13 +136,49 @@ class DockerFileManager:
                     f"[yellow]Warning: Could not set PostgreSQL directory permissions: {e}[/]"
                 )
 
+        self._dirs_created = True
         return directories
 
-    def _generate_env_file(self, non_interactive: bool = False) -> FileOperationResult:
+    def _template_context(self) -> dict[str, Any]:
+        """Build the template values shared by all generated files.
+
+        Returns:
+            dict[str, Any]: Context common to the .env, compose and system.yaml templates
+        """
+        # A single stat answers both "exists" for compose and "is it a directory"
+        # for the system.yaml writer
+        try:
+            system_yaml_mode: int | None = os.stat(
+                self.config.data_dir / "etc" / "system.yaml"
+            ).st_mode
+        except OSError:
+            system_yaml_mode = None
+
+        return {
+            "artifactory_version": self.config.version,
+            "data_dir": str(self.config.data_dir.absolute()),
+            "external_port": self.config.port,
+            "postgres_user": self.config.postgres_user,
+            "postgres_password": self.config.generate_password(POSTGRES_PASSWORD_KEY),
+            "postgres_db": self.config.postgres_db,
+            "use_postgres": self.config.use_postgres,
+            "joinkey": self.config.generate_joinkey(),
+            "platform": platform.system(),
+            # Checked up front since system.yaml may be written concurrently
+            "system_yaml_exists": system_yaml_mode is not None,
+            "system_yaml_is_dir": (
+                system_yaml_mode is not None and stat.S_ISDIR(system_yaml_mode)
+            ),
+        }
+
+    def _generate_env_file(
+        self, non_interactive: bool = False, context: dict[str, Any] | None = None
+    ) -> FileOperationResult:
         """Generate .env file.
 
         Args:
             non_interactive: Whether to skip confirmation prompts
+            context: Shared template context, built on demand when omitted
 
         Returns:
             FileOperationResult: Result of the operation
@@ -125,18 +186,7 @@ class DockerFileManager:
         if self.config.output_dir is None:
             raise ValueError("output_dir must be set before generating files")
         env_content = render_template_from_file(
-            "docker",
-            "env.j2",
-            {
-                "artifactory_version": self.config.version,
-                "data_dir": str(self.config.data_dir.absolute()),
-                "external_port": self.config.port,
-                "postgres_user": self.config.postgres_user,
-                "postgres_password": self.config.generate_password("postgres"),
-                "postgres_db": self.config.postgres_db,
-                "use_postgres": self.config.use_postgres,
-                "joinkey": self.config.generate_joinkey(),
-            },
+            "docker", "env.j2", context or self._template_context()
         )
 
         result = safe_write_file(
@@ -149,36 +199,28 @@ class DockerFileManager:
         return result
 
     def _generate_docker_compose(
-        self, non_interactive: bool = False
+        self, non_interactive: bool = False, context: dict[str, Any] | None = None
     ) -> FileOperationResult:
         """Generate docker-compose.yml file.
 
         Args:
             non_interactive: Whether to skip confirmation prompts
+            context: Shared template context, built on demand when omitted
 
         Returns:
             FileOperationResult: Result of the operation
         """
         if self.config.output_dir is None:
             raise ValueError("output_dir must be set before generating files")
-        # System YAML check
-        system_yaml_exists = (self.config.data_dir / "etc" / "system.yaml").exists()
-
         # Setup template context
-        template_context = {
-            "docker_registry": "releases-docker.jfrog.io",
-            "artifactory_version": self.config.version,
-            "external_port": self.config.port,
-            "data_dir": str(self.config.data_dir.absolute()),
-            "postgres_user": self.config.postgres_user,
-            "postgres_password": self.config.get_password("postgres"),
-            "postgres_db": self.config.postgres_db,
-            "db_type": "postgresql" if self.config.use_postgres else "derby",
-            "use_postgres": self.config.use_postgres,
-            "joinkey": self.config.joinkey,
-            "use_named_volumes": self.use_named_volumes,
-            "system_yaml_exists": system_yaml_exists,
-        }
+        template_context = dict(context or self._template_context())
+        template_context.update(
+            {
+                "docker_registry": "releases-docker.jfrog.io",
+                "db_type": self.config.database_type.value,
+                "use_named_volumes": self.use_named_volumes,
+            }
+        )
 
         # Add volume names if using named volumes
         if self.use_named_volumes:
@@ -217,38 +259,32 @@ class DockerFileManager:
         return result
 
     def _generate_system_yaml(
-        self, non_interactive: bool = False
+        self, non_interactive: bool = False, context: dict[str, Any] | None = None
     ) -> FileOperationResult:
         """Generate system.yaml file.
 
         Args:
             non_interactive: Whether to skip confirmation prompts
+            context: Shared template context, built on demand when omitted
 
         Returns:
             FileOperationResult: Result of the operation
         """
         if self.config.output_dir is None:
             raise ValueError("output_dir must be set before generating files")
+        context = context or self._template_context()
         system_yaml_content = render_template_from_file(
-            "docker",
-            "system.yaml.j2",
-            {
-                "use_postgres": self.config.use_postgres,
-                "postgres_user": self.config.postgres_user,
-                "postgres_password": self.config.get_password("postgres"),
-                "postgres_db": self.config.postgres_db,
-                "joinkey": self.config.generate_joinkey(),
-                "platform": platform.system(),
-            },
+            "docker", "system.yaml.j2", context
         )
 
-        # Make sure the etc directory exists
+        # Make sure the etc directory exists, unless create_directories did
         etc_dir = self.config.data_dir / "etc"
-        etc_dir.mkdir(parents=True, exist_ok=True)
+        if not self._dirs_created:
+            etc_dir.mkdir(parents=True, exist_ok=True)
 
         # If system.yaml is somehow a directory, remove it (common issue causing failures)
         system_yaml_path = etc_dir / "system.yaml"
-        if system_yaml_path.exists() and system_yaml_path.is_dir():
+        if context["system_yaml_is_dir"]:
             try:
                 shutil.rmtree(system_yaml_path)
                 self.console.print(
@@ -275,15 +311,27 @@ class DockerFileManager:
             )
             return main_result
 
-        # Also write to output dir for reference
-        ref_result = safe_write_file(
-            self.config.output_dir / "system.yaml", system_yaml_content, non_interactive
-        )
-
-        if not ref_result.success:
-            self.console.print(
-                "[yellow]Note: Failed to create reference copy of system.yaml[/]"
-            )
+        # Also place a reference copy in the output dir. It is copied from the
+        # file just written rather than hard-linked: Artifactory and users edit
+        # etc/system.yaml in place, and the reference must stay a snapshot of
+        # what was generated.
+        ref_path = self.config.output_dir / "system.yaml"
+        if ref_path != system_yaml_path:
+            if (
+                ref_path.is_file()
+                and not non_interactive
+                and not typer.confirm(
+                    f"File {ref_path} already exists. Overwrite?", default=True
+                )
+            ):
+                self.console.print("[yellow]Skipping reference copy of system.yaml.[/]")
+                return main_result
+            try:
+                shutil.copyfile(system_yaml_path, ref_path)
+            except OSError:
+                self.console.print(
+                    "[yellow]Note: Failed to create reference copy of system.yaml[/]"
+                )
 
         return main_result
 
@@ -4,20 +4,106 @@ This module provides functionality to create, manage, backup, and migrate
 Artifactory data between Docker volumes.
 """
 
+import asyncio
 import datetime
 import json
+import os
+import shutil
+import stat
 import subprocess  # nosec B404
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from rich.console import Console
-import os
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..common import OperationStatus, run_docker_command
 
+# Seconds an inspected volume's metadata is reused before asking docker again
+VOLUME_INFO_TTL_SECONDS = 5.0
+
+
+def _directory_size(path: Path) -> int | None:
+    """Get the apparent size of a directory tree, like ``du -sb``.
+
+    Hard-linked files are counted once and symlinks are not followed.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Optional[int]: Size in bytes, or None if any part of the tree could
+        not be read
+    """
+    try:
+        total = path.lstat().st_size
+        seen: set[tuple[int, int]] = set()
+        pending = [os.fspath(path)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    info = entry.stat(follow_symlinks=False)
+                    if stat.S_ISDIR(info.st_mode):
+                        pending.append(entry.path)
+                    elif info.st_nlink > 1:
+                        key = (info.st_dev, info.st_ino)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    total += info.st_size
+        return total
+    except OSError:
+        return None
+
+
+def _format_size(size_bytes: int) -> tuple[float, str]:
+    """Pair a size in bytes with its human-readable form.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Tuple[float, str]: Size in bytes and human-readable format
+    """
+    units = ["B", "KB", "MB", "GB", "TB"]
+    # Largest unit the size exceeds (strictly, so 1024 B stays in bytes),
+    # counted in 10-bit steps
+    unit_index = min(len(units) - 1, (max(size_bytes - 1, 1).bit_length() - 1) // 10)
+    size_human = size_bytes / (1 << (unit_index * 10))
+
+    return (size_bytes, f"{size_human:.2f} {units[unit_index]}")
+
+
+def _is_root() -> bool:
+    """Check whether the current process runs as root (always False on Windows)."""
+    return hasattr(os, "geteuid") and os.geteuid() == 0
+
+
+def _host_mountpoint(volume_info: dict[str, Any]) -> Path | None:
+    """Get the host directory holding a volume's data, if it is reachable.
+
+    Only plain ``local`` volumes qualify: volumes created with driver options
+    (e.g. ``o=bind``) keep their data on the device and only appear under the
+    mountpoint while a container uses them.
+
+    Args:
+        volume_info: Volume information from ``docker volume inspect``
+
+    Returns:
+        Optional[Path]: Mountpoint directory, or None if it is not on this host
+    """
+    if volume_info.get("Driver") != "local" or volume_info.get("Options"):
+        return None
+    mountpoint = volume_info.get("Mountpoint")
+    if not mountpoint or not os.path.isdir(mountpoint):
+        return None
+    return Path(mountpoint)
+
 
 class VolumeType(str, Enum):
     """Types of volumes used by Artifactory."""
@@ -37,22 +123,39 @@ class VolumeManager:
         self,
         console: Console | None = None,
         volume_prefix: str = "artifactory",
+        managed_only: bool = False,
     ):
         """Initialize volume manager.
 
         Args:
             console: Console for output
             volume_prefix: Prefix for volume names
+            managed_only: List only volumes created by sapo (filtered on its
+                managed-by label) instead of every volume matching the prefix,
+                which includes the PostgreSQL volume created by docker compose
         """
         self.console = console or Console()
         self.volume_prefix = volume_prefix
+        self.managed_only = managed_only
         self.default_labels = {
             "com.jfrog.artifactory.managed-by": "sapo",
             "com.jfrog.artifactory.created-at": datetime.datetime.now().isoformat(),
         }
+        # Default labels rendered once as "key=value" for every create_volume
+        self._default_label_args = {
+            key: f"{key}={value}" for key, value in self.default_labels.items()
+        }
+        self._docker_available: bool | None = None
+        # Volume name -> (monotonic time inspected, docker volume inspect data)
+        self._info_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     def _run_command(
-        self, cmd: list[str], check: bool = True, capture_output: bool = True
+        self,
+        cmd: list[str],
+        check: bool = True,
+        capture_output: bool = True,
+        discard_output: bool = False,
+        **kwargs: Any,
     ) -> subprocess.CompletedProcess:
         """Run a command and return the result.
 
@@ -60,6 +163,9 @@ class VolumeManager:
             cmd: Command to run
             check: Whether to check return code
             capture_output: Whether to capture output
+            discard_output: Send stdout to /dev/null, keeping only stderr for
+                error reporting; for commands whose output is never read
+            **kwargs: Additional arguments to pass to subprocess.run
 
         Returns:
             subprocess.CompletedProcess: Command result
@@ -67,8 +173,15 @@ class VolumeManager:
         Raises:
             subprocess.CalledProcessError: If command fails and check is True
         """
+        if discard_output:
+            capture_output = False
+            kwargs.setdefault("stdout", subprocess.DEVNULL)
+            kwargs.setdefault("stderr", subprocess.PIPE)
+
         try:
-            return run_docker_command(cmd, check=check, capture_output=capture_output)
+            return run_docker_command(
+                cmd, check=check, capture_output=capture_output, **kwargs
+            )
         except subprocess.CalledProcessError as e:
             self.console.print(f"[bold red]Command failed:[/] {' '.join(cmd)}")
             self.console.print(f"[red]Error:[/] {e}")
@@ -77,17 +190,23 @@ class VolumeManager:
     def is_docker_available(self) -> bool:
         """Check if Docker is available.
 
+        The probe runs once per manager; later calls reuse its result.
+
         Returns:
             bool: True if Docker is available
         """
+        if self._docker_available is not None:
+            return self._docker_available
+
         try:
             self._run_command(["docker", "--version"])
-            return True
+            self._docker_available = True
         except (subprocess.SubprocessError, FileNotFoundError):
             self.console.print(
                 "[bold red]Error:[/] Docker not found. Please install Docker and try again."
             )
-            return False
+            self._docker_available = False
+        return self._docker_available
 
     def list_volumes(self) -> list[dict[str, str]]:
         """List all Artifactory volumes.
@@ -98,6 +217,12 @@ class VolumeManager:
         if not self.is_docker_available():
             return []
 
+        # Let the daemon drop unrelated volumes before they reach us
+        if self.managed_only:
+            volume_filter = "label=com.jfrog.artifactory.managed-by=sapo"
+        else:
+            volume_filter = f"name={self.volume_prefix}"
+
         try:
             result = self._run_command(
                 [
@@ -105,22 +230,28 @@ class VolumeManager:
                     "volume",
                     "ls",
                     "--filter",
-                    f"name={self.volume_prefix}",
+                    volume_filter,
                     "--format",
-                    "{{.Name}},{{.Driver}},{{.Mountpoint}}",
+                    "{{json .}}",
                 ]
             )
 
+            # One JSON object per line, so commas in mountpoints are harmless
             volumes = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
+            for line in result.stdout.splitlines():
+                if not line.strip():
                     continue
-                parts = line.split(",")
-                if len(parts) >= 3:
-                    name, driver, mountpoint = parts
+                try:
+                    entry = json.loads(line)
                     volumes.append(
-                        {"name": name, "driver": driver, "mountpoint": mountpoint}
+                        {
+                            "name": entry["Name"],
+                            "driver": entry["Driver"],
+                            "mountpoint": entry["Mountpoint"],
+                        }
                     )
+                except (ValueError, KeyError, TypeError):
+                    continue
             return volumes
         except Exception as e:
             self.console.print(f"[red]Error listing volumes: {e}[/]")
@@ -190,32 +321,43 @@ class VolumeManager:
 
         # Add driver options if specified
         if driver_opts:
-            for key, value in driver_opts.items():
-                cmd.extend(["--opt", f"{key}={value}"])
-
-        # Prepare labels
-        all_labels = self.default_labels.copy()
+            cmd.extend(
+                chain.from_iterable(
+                    ("--opt", f"{key}={value}") for key, value in driver_opts.items()
+                )
+            )
 
-        # Add volume type and purpose
-        all_labels["com.jfrog.artifactory.volume-type"] = volume_type.value
-        all_labels["com.jfrog.artifactory.purpose"] = self._get_purpose_for_type(
-            volume_type
-        )
+        # Prepare per-volume labels: volume type and purpose
+        volume_labels = {
+            "com.jfrog.artifactory.volume-type": volume_type.value,
+            "com.jfrog.artifactory.purpose": self._get_purpose_for_type(volume_type),
+        }
 
         # Add display name if provided
         if display_name:
-            all_labels["com.jfrog.artifactory.display-name"] = display_name
+            volume_labels["com.jfrog.artifactory.display-name"] = display_name
 
         # Add custom labels
         if labels:
-            all_labels.update(labels)
-
-        # Add labels to command
-        for key, value in all_labels.items():
-            cmd.extend(["--label", f"{key}={value}"])
+            volume_labels.update(labels)
+
+        # Add labels to command, letting per-volume labels override defaults
+        cmd.extend(
+            chain.from_iterable(
+                ("--label", label)
+                for key, label in self._default_label_args.items()
+                if key not in volume_labels
+            )
+        )
+        cmd.extend(
+            chain.from_iterable(
+                ("--label", f"{key}={value}") for key, value in volume_labels.items()
+            )
+        )
 
         try:
-            self._run_command(cmd)
+            self._run_command(cmd, discard_output=True)
+            self._info_cache.pop(volume_name, None)
             self.console.print(f"[green]Created volume:[/] {volume_name}")
             return volume_name
         except Exception as e:
@@ -259,8 +401,9 @@ class VolumeManager:
             cmd.append("--force")
         cmd.append(volume_name)
 
+        self._info_cache.pop(volume_name, None)
         try:
-            self._run_command(cmd)
+            self._run_command(cmd, discard_output=True)
             self.console.print(f"[green]Deleted volume:[/] {volume_name}")
             return True
         except Exception as e:
@@ -304,28 +447,38 @@ class VolumeManager:
             task = progress.add_task(f"Backing up {volume_name}...", total=None)
 
             try:
-                # Create a temporary container that mounts the volume and tar its contents
-                tar_command = "tar"
-                if compress:
-                    tar_command += " -czf"  # Compress with gzip
-                else:
-                    tar_command += " -cf"
+                # Create a temporary container that mounts the volume and streams
+                # a tar of its contents to stdout, written straight to the
+                # backup file so the backup directory is never bind-mounted.
+                # When pigz is installed on the host it compresses the stream on
+                # all cores instead of tar's single-threaded gzip
+                pigz_path = shutil.which("pigz") if compress else None
+                tar_flags = "-czf" if compress and not pigz_path else "-cf"
+                tar_cmd = [
+                    "docker",
+                    "run",
+                    "--rm",
+                    "-v",
+                    f"{volume_name}:/source",
+                    "alpine",
+                    "tar",
+                    tar_flags,
+                    "-",
+                    "-C",
+                    "/source",
+                    ".",
+                ]
 
-                self._run_command(
-                    [
-                        "docker",
-                        "run",
-                        "--rm",
-                        "-v",
-                        f"{volume_name}:/source",
-                        "-v",
-                        f"{backup_file.parent}:/backup",
-                        "alpine",
-                        "sh",
-                        "-c",
-                        f"{tar_command} /backup/{backup_file.name} -C /source .",
-                    ]
-                )
+                with open(backup_file, "wb") as archive:
+                    if pigz_path:
+                        self._run_compressed(tar_cmd, pigz_path, archive)
+                    else:
+                        self._run_command(
+                            tar_cmd,
+                            capture_output=False,
+                            stdout=archive,
+                            stderr=subprocess.PIPE,
+                        )
 
                 # Also include volume metadata
                 volume_info = self.get_volume_info(volume_name)
@@ -347,10 +500,43 @@ class VolumeManager:
                 return OperationStatus.SUCCESS, backup_file
 
             except Exception as e:
+                # Don't leave a truncated archive behind
+                backup_file.unlink(missing_ok=True)
                 progress.update(task, description=f"Backup failed: {e}")
                 self.console.print(f"[bold red]Failed to backup volume:[/] {e}")
                 return OperationStatus.ERROR, None
 
+    def _run_compressed(
+        self, cmd: list[str], pigz_path: str, output: IO[bytes]
+    ) -> None:
+        """Run a command and compress its stdout into a file with pigz.
+
+        Args:
+            cmd: Docker command writing an uncompressed stream to stdout
+            pigz_path: Full path to the pigz executable
+            output: Binary file receiving the compressed stream
+
+        Raises:
+            subprocess.CalledProcessError: If the command or pigz fails
+        """
+        pigz_cmd = [pigz_path, "-p", str(os.cpu_count() or 1)]
+        with subprocess.Popen(  # nosec B603
+            pigz_cmd, stdin=subprocess.PIPE, stdout=output
+        ) as pigz:
+            try:
+                self._run_command(
+                    cmd,
+                    capture_output=False,
+                    stdout=pigz.stdin,
+                    stderr=subprocess.PIPE,
+                )
+            finally:
+                if pigz.stdin is not None:
+                    pigz.stdin.close()
+
+        if pigz.returncode != 0:
+            raise subprocess.CalledProcessError(pigz.returncode, pigz_cmd)
+
     def restore_volume(
         self,
         backup_file: Path,
@@ -392,7 +578,8 @@ class VolumeManager:
                 return OperationStatus.ERROR, None
 
             try:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+                now = datetime.datetime.now()
+                timestamp = now.strftime("%Y%m%d%H%M%S")
                 display_name = f"Restored {volume_type.value} ({timestamp})"
 
                 # Extract original volume name from backup filename for labels
@@ -401,7 +588,7 @@ class VolumeManager:
                 # Add metadata about restore operation
                 labels = {
                     "com.jfrog.artifactory.restored-from": original_name,
-                    "com.jfrog.artifactory.restored-at": datetime.datetime.now().isoformat(),
+                    "com.jfrog.artifactory.restored-at": now.isoformat(),
                     "com.jfrog.artifactory.backup-file": backup_file.name,
                 }
 
@@ -436,22 +623,35 @@ class VolumeManager:
                 if is_compressed:
                     tar_command = "tar -xzf"  # Extract gzipped tar
 
-                # Create a temporary container that mounts the volume and extracts the tar
-                self._run_command(
-                    [
-                        "docker",
-                        "run",
-                        "--rm",
-                        "-v",
-                        f"{volume_name}:/target",
-                        "-v",
-                        f"{backup_file.parent}:/backup",
-                        "alpine",
-                        "sh",
-                        "-c",
-                        f"rm -rf /target/* /target/.[!.]* && {tar_command} /backup/{backup_file.name} -C /target",
-                    ]
-                )
+                # Local volumes can be extracted into straight from the host,
+                # skipping the container. Only root can keep the archived
+                # owners (rootless daemons store data under subuids), so
+                # anyone else goes through the container.
+                volume_info = self.get_volume_info(volume_name)
+                mountpoint = _host_mountpoint(volume_info) if volume_info else None
+                host_tar = shutil.which("tar")
+                if mountpoint and host_tar and _is_root():
+                    self._extract_on_host(
+                        host_tar, backup_file, mountpoint, compressed=is_compressed
+                    )
+                else:
+                    # Create a temporary container that mounts the volume and extracts the tar
+                    self._run_command(
+                        [
+                            "docker",
+                            "run",
+                            "--rm",
+                            "-v",
+                            f"{volume_name}:/target",
+                            "-v",
+                            f"{backup_file.parent}:/backup",
+                            "alpine",
+                            "sh",
+                            "-c",
+                            f"rm -rf /target/* /target/.[!.]* && {tar_command} /backup/{backup_file.name} -C /target",
+                        ],
+                        discard_output=True,
+                    )
 
                 progress.update(
                     task,
@@ -468,6 +668,56 @@ class VolumeManager:
                 self.console.print(f"[bold red]Failed to restore volume:[/] {e}")
                 return OperationStatus.ERROR, None
 
+    @staticmethod
+    def _extract_on_host(
+        host_tar: str, backup_file: Path, mountpoint: Path, compressed: bool = False
+    ) -> None:
+        """Replace a volume's contents with a backup, extracted on the host.
+
+        The archive is listed first, so an unreadable backup leaves the volume
+        untouched. Owners are restored by number, as the container would,
+        instead of being mapped through the host's user database.
+
+        Args:
+            host_tar: Host tar executable
+            backup_file: Path to backup file
+            mountpoint: Host directory holding the volume's data
+            compressed: Whether the backup is gzipped
+
+        Raises:
+            OSError: If the existing contents cannot be removed
+            subprocess.CalledProcessError: If tar cannot read or extract the backup
+        """
+        gzip_flag = ["-z"] if compressed else []
+        subprocess.run(  # nosec B603
+            [host_tar, "-t", *gzip_flag, "-f", os.fspath(backup_file)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+        with os.scandir(mountpoint) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+
+        subprocess.run(  # nosec B603
+            [
+                host_tar,
+                "-x",
+                *gzip_flag,
+                "--numeric-owner",
+                "-f",
+                os.fspath(backup_file),
+                "-C",
+                os.fspath(mountpoint),
+            ],
+            check=True,
+            capture_output=True,
+        )
+
     def get_volume_info(self, volume_name: str) -> dict[str, Any] | None:
         """Get information about a volume.
 
@@ -480,24 +730,59 @@ class VolumeManager:
         if not self.is_docker_available():
             return None
 
+        cached = self._info_cache.get(volume_name)
+        if cached and time.monotonic() - cached[0] < VOLUME_INFO_TTL_SECONDS:
+            return cached[1]
+
         try:
             result = self._run_command(["docker", "volume", "inspect", volume_name])
 
-            import json
-
             volumes: list[dict[str, Any]] = json.loads(result.stdout)
             if volumes and len(volumes) > 0:
                 volume_info: dict[str, Any] = volumes[0]
+                self._info_cache[volume_name] = (time.monotonic(), volume_info)
                 return volume_info
             return None
         except Exception:
             return None
 
-    def get_volume_size(self, volume_name: str) -> tuple[float, str] | None:
+    def get_volumes_info(self, volume_names: list[str]) -> dict[str, dict[str, Any]]:
+        """Get information about several volumes with a single inspect.
+
+        Args:
+            volume_names: Names of volumes
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Volume information by name; volumes that
+            do not exist are left out
+        """
+        if not volume_names or not self.is_docker_available():
+            return {}
+
+        try:
+            # docker volume inspect still prints the volumes it found (and
+            # exits non-zero) when some of the names do not exist
+            result = self._run_command(
+                ["docker", "volume", "inspect", *volume_names], check=False
+            )
+            volumes: list[dict[str, Any]] = json.loads(result.stdout or "[]")
+            inspected_at = time.monotonic()
+            volumes_info = {volume["Name"]: volume for volume in volumes}
+            for name, volume_info in volumes_info.items():
+                self._info_cache[name] = (inspected_at, volume_info)
+            return volumes_info
+        except Exception:
+            return {}
+
+    def get_volume_size(
+        self, volume_name: str, volume_info: dict[str, Any] | None = None
+    ) -> tuple[float, str] | None:
         """Get the size of a volume in human-readable format.
 
         Args:
             volume_name: Name of volume
+            volume_info: Already inspected volume information, looked up when
+                omitted
 
         Returns:
             Optional[Tuple[float, str]]: Size in bytes and human-readable format
@@ -506,43 +791,94 @@ class VolumeManager:
             return None
 
         try:
-            volume_info = self.get_volume_info(volume_name)
+            if volume_info is None:
+                volume_info = self.get_volume_info(volume_name)
             if not volume_info or "Mountpoint" not in volume_info:
                 return None
 
-            # Run du command in container to get size
-            result = self._run_command(
-                [
-                    "docker",
-                    "run",
-                    "--rm",
-                    "-v",
-                    f"{volume_name}:/volume",
-                    "alpine",
-                    "du",
-                    "-sb",
-                    "/volume",
-                ]
-            )
-
-            # Parse output like "12345 /volume"
-            size_str = result.stdout.strip().split()[0]
-            size_bytes = int(size_str)
-
-            # Convert to human-readable format
-            units = ["B", "KB", "MB", "GB", "TB"]
-            size_human = float(size_bytes)
-            unit_index = 0
+            # Local volumes live on this host, so walk them directly when the
+            # mountpoint is readable (not the case with Docker Desktop's VM or
+            # without root)
+            size_bytes = None
+            mountpoint = _host_mountpoint(volume_info)
+            if mountpoint is not None:
+                size_bytes = _directory_size(mountpoint)
+
+            if size_bytes is None:
+                # Run du command in container to get size
+                result = self._run_command(
+                    [
+                        "docker",
+                        "run",
+                        "--rm",
+                        "-v",
+                        f"{volume_name}:/volume",
+                        "alpine",
+                        "du",
+                        "-sb",
+                        "/volume",
+                    ]
+                )
 
-            while size_human > 1024 and unit_index < len(units) - 1:
-                size_human /= 1024
-                unit_index += 1
+                # Parse output like "12345 /volume"
+                size_str = result.stdout.strip().split()[0]
+                size_bytes = int(size_str)
 
-            return (size_bytes, f"{size_human:.2f} {units[unit_index]}")
+            return _format_size(size_bytes)
         except Exception as e:
             self.console.print(f"[yellow]Could not determine volume size: {e}[/]")
             return None
 
+    def get_volume_sizes(
+        self, volumes_info: dict[str, dict[str, Any]]
+    ) -> dict[str, tuple[float, str] | None]:
+        """Get the sizes of several volumes.
+
+        Volumes reachable on this host are walked directly; the rest are all
+        mounted into a single du container instead of one container each.
+
+        Args:
+            volumes_info: Volume information by name, as from get_volumes_info
+
+        Returns:
+            Dict[str, Optional[Tuple[float, str]]]: Size in bytes and
+            human-readable format by volume name, None where unknown
+        """
+        sizes: dict[str, tuple[float, str] | None] = dict.fromkeys(volumes_info)
+        if not self.is_docker_available():
+            return sizes
+
+        remaining = []
+        for name, volume_info in volumes_info.items():
+            mountpoint = _host_mountpoint(volume_info)
+            size_bytes = _directory_size(mountpoint) if mountpoint else None
+            if size_bytes is None:
+                remaining.append(name)
+            else:
+                sizes[name] = _format_size(size_bytes)
+
+        if not remaining:
+            return sizes
+
+        cmd = ["docker", "run", "--rm"]
+        for index, name in enumerate(remaining):
+            cmd.extend(["-v", f"{name}:/volumes/{index}"])
+        cmd.extend(["alpine", "du", "-sb"])
+        cmd.extend(f"/volumes/{index}" for index in range(len(remaining)))
+
+        try:
+            # du still reports the volumes it could read if one of them fails
+            result = self._run_command(cmd, check=False)
+            # Lines look like "12345\t/volumes/0"
+            for line in result.stdout.splitlines():
+                size_str, path = line.split()
+                index = int(path.rsplit("/", 1)[-1])
+                sizes[remaining[index]] = _format_size(int(size_str))
+        except Exception as e:
+            self.console.print(f"[yellow]Could not determine volume sizes: {e}[/]")
+
+        return sizes
+
     def display_volumes(self) -> None:
         """Display information about all Artifactory volumes."""
         volumes = self.list_volumes()
@@ -558,17 +894,22 @@ class VolumeManager:
         table.add_column("Type", style="yellow")
         table.add_column("Mountpoint", style="blue")
 
+        # Inspect every volume in one call rather than once per row
+        volumes_info = self.get_volumes_info([volume["name"] for volume in volumes])
+
+        sizes = self.get_volume_sizes(volumes_info)
+
         for volume in volumes:
             name = volume["name"]
             driver = volume["driver"]
             mountpoint = volume["mountpoint"]
+            volume_info = volumes_info.get(name)
 
             # Get volume size
-            size_info = self.get_volume_size(name)
+            size_info = sizes.get(name)
             size = size_info[1] if size_info else "Unknown"
 
-            # Get volume info to determine type
-            volume_info = self.get_volume_info(name)
+            # Use the volume info to determine type
             volume_type = "Unknown"
             if volume_info and "Labels" in volume_info:
                 labels = volume_info["Labels"]
@@ -601,9 +942,10 @@ class VolumeManager:
         Returns:
             Dict[VolumeType, str]: Map of volume types to volume names
         """
+        # One clock reading names the whole set and stamps its labels
+        now = datetime.datetime.now()
         if not name_suffix:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-            name_suffix = timestamp
+            name_suffix = now.strftime("%Y%m%d%H%M%S")
 
         volumes = {}
 
@@ -617,9 +959,7 @@ class VolumeManager:
             all_labels["com.jfrog.artifactory.version"] = artifactory_version
 
         # Add installation timestamp
-        all_labels["com.jfrog.artifactory.install-timestamp"] = (
-            datetime.datetime.now().isoformat()
-        )
+        all_labels["com.jfrog.artifactory.install-timestamp"] = now.isoformat()
 
         # Create default size options if not provided
         if not size_opts:
@@ -645,7 +985,8 @@ class VolumeManager:
                             f"[yellow]Warning: Unknown volume type '{key}', skipping host path[/]"
                         )
 
-        # Create each volume type
+        # Prepare the arguments for each volume type
+        volume_specs: dict[VolumeType, dict[str, Any]] = {}
         for volume_type in [
             VolumeType.DATA,
             VolumeType.LOGS,
@@ -653,53 +994,61 @@ class VolumeManager:
             VolumeType.POSTGRESQL,
             VolumeType.ETC,
         ]:
-            try:
-                # Prepare display name
-                display_name = f"Artifactory {volume_type.value}"
-                if artifactory_version:
-                    display_name += f" ({artifactory_version})"
-
-                # Get host path if specified
-                host_path = None
-                if normalized_host_paths and volume_type in normalized_host_paths:
-                    host_path = normalized_host_paths[volume_type]
-
-                # Get driver options for this volume type
-                driver_opts = None
-                if driver and driver != "local" and size_opts:
-                    if isinstance(size_opts, dict):
-                        # Handle both string and enum keys
-                        if volume_type in size_opts:
-                            driver_opts = size_opts[volume_type]
-                        elif volume_type.value in size_opts:
-                            driver_opts = size_opts[volume_type.value]
-                        # If no specific size opts found, use default
-
-                # Create the volume
-                volume_name = self.create_volume(
-                    volume_type,
-                    name_suffix,
-                    driver=driver,
-                    driver_opts=driver_opts,
-                    labels=all_labels,
-                    host_path=host_path,
-                    display_name=display_name,
+            # Prepare display name
+            display_name = f"Artifactory {volume_type.value}"
+            if artifactory_version:
+                display_name += f" ({artifactory_version})"
+
+            # Get driver options for this volume type
+            driver_opts = None
+            if driver and driver != "local" and size_opts:
+                if isinstance(size_opts, dict):
+                    # Handle both string and enum keys
+                    if volume_type in size_opts:
+                        driver_opts = size_opts[volume_type]
+                    elif volume_type.value in size_opts:
+                        driver_opts = size_opts[volume_type.value]
+                    # If no specific size opts found, use default
+
+            volume_specs[volume_type] = {
+                "driver": driver,
+                # create_volume adds bind options in place, so pass a copy
+                "driver_opts": dict(driver_opts) if driver_opts else None,
+                "labels": all_labels,
+                "host_path": normalized_host_paths.get(volume_type),
+                "display_name": display_name,
+            }
+
+        # The volumes are independent, so create them concurrently
+        with ThreadPoolExecutor(max_workers=len(volume_specs)) as executor:
+            futures = {
+                volume_type: executor.submit(
+                    self.create_volume, volume_type, name_suffix, **spec
                 )
-                volumes[volume_type] = volume_name
+                for volume_type, spec in volume_specs.items()
+            }
 
+        errors: dict[VolumeType, Exception] = {}
+        for volume_type, future in futures.items():
+            try:
+                volumes[volume_type] = future.result()
             except Exception as e:
+                errors[volume_type] = e
+
+        if errors:
+            for volume_type, error in errors.items():
                 self.console.print(
-                    f"[bold red]Failed to create volume for {volume_type.value}:[/] {e}"
+                    f"[bold red]Failed to create volume for {volume_type.value}:[/] {error}"
                 )
 
-                # Clean up created volumes on failure
-                for created_type, created_name in volumes.items():
-                    self.console.print(
-                        f"[yellow]Cleaning up volume {created_name}...[/]"
-                    )
-                    self.delete_volume(created_name, force=True)
+            # Clean up created volumes on failure
+            for created_name in volumes.values():
+                self.console.print(f"[yellow]Cleaning up volume {created_name}...[/]")
+                self.delete_volume(created_name, force=True)
 
-                raise RuntimeError(f"Failed to create volume set: {e}")
+            raise RuntimeError(
+                f"Failed to create volume set: {next(iter(errors.values()))}"
+            )
 
         return volumes
 
@@ -722,33 +1071,60 @@ class VolumeManager:
         return compose_volumes
 
     async def migrate_data(
-        self, source_volume: str, target_volume: str, temp_dir: Path
+        self, source_volume: str, target_volume: str, temp_dir: Path | None = None
     ) -> bool:
         """Migrate data from one volume to another.
 
+        By default the data is copied directly between the volumes. When
+        ``temp_dir`` is given, the source is instead backed up to an archive
+        there and restored from it, and the archive is kept.
+
         Args:
             source_volume: Source volume name
             target_volume: Target volume name
-            temp_dir: Temporary directory for backup
+            temp_dir: Optional temporary directory for an intermediate backup
 
         Returns:
             bool: True if migration was successful
         """
+        # The copy clears the target first, which would wipe a shared source
+        if source_volume == target_volume:
+            self.console.print(
+                "[bold red]Error:[/] Source and target volumes must be different"
+            )
+            return False
+
         self.console.print(
             f"[bold]Migrating data from {source_volume} to {target_volume}...[/]"
         )
 
+        # The docker commands block, so run them in worker threads to keep
+        # the event loop free (e.g. for several migrations under gather)
+        if temp_dir is None:
+            if not await asyncio.to_thread(
+                self._copy_volume, source_volume, target_volume
+            ):
+                return False
+            self.console.print(
+                f"[green]Successfully migrated data from {source_volume} to {target_volume}[/]"
+            )
+            return True
+
         # Create temporary directory
         temp_dir.mkdir(parents=True, exist_ok=True)
 
         # Backup source volume
-        status, backup_file = self.backup_volume(source_volume, temp_dir, compress=True)
+        status, backup_file = await asyncio.to_thread(
+            self.backup_volume, source_volume, temp_dir, compress=True
+        )
         if status != OperationStatus.SUCCESS or not backup_file:
             self.console.print("[bold red]Failed to backup source volume.[/]")
             return False
 
         # Restore to target volume
-        status, _ = self.restore_volume(backup_file, target_volume)
+        status, _ = await asyncio.to_thread(
+            self.restore_volume, backup_file, target_volume
+        )
         if status != OperationStatus.SUCCESS:
             self.console.print("[bold red]Failed to restore to target volume.[/]")
             return False
@@ -756,29 +1132,84 @@ class VolumeManager:
         self.console.print(
             f"[green]Successfully migrated data from {source_volume} to {target_volume}[/]"
         )
+        self.console.print(f"[green]Backup archive kept at:[/] {backup_file}")
+
+        return True
+
+    def _copy_volume(self, source_volume: str, target_volume: str) -> bool:
+        """Replace the contents of a volume with a copy of another volume.
+
+        Args:
+            source_volume: Source volume name
+            target_volume: Target volume name
+
+        Returns:
+            bool: True if the copy was successful
+        """
+        if not self.is_docker_available():
+            return False
 
-        # Clean up backup file
         try:
-            backup_file.unlink()
-            self.console.print(
-                f"[green]Removed temporary backup file: {backup_file}[/]"
+            # Mount both volumes in one container so no archive is written
+            self._run_command(
+                [
+                    "docker",
+                    "run",
+                    "--rm",
+                    "-v",
+                    f"{source_volume}:/source:ro",
+                    "-v",
+                    f"{target_volume}:/target",
+                    "alpine",
+                    "sh",
+                    "-c",
+                    "rm -rf /target/* /target/.[!.]* && cp -a /source/. /target/",
+                ],
+                discard_output=True,
             )
+            return True
         except Exception as e:
-            self.console.print(
-                f"[yellow]Could not remove temporary backup file: {e}[/]"
-            )
+            self.console.print(f"[bold red]Failed to copy volume data:[/] {e}")
+            return False
 
-        return True
+    @staticmethod
+    def migration_labels(source_path: Path) -> dict[str, str]:
+        """Get the labels recording a migration from a bind mount.
+
+        Docker volume labels can only be set when a volume is created, so pass
+        these to create_volume for the target of migrate_from_bind_mount.
+
+        Args:
+            source_path: Path to the bind mount being migrated
+
+        Returns:
+            Dict[str, str]: Migration source and time labels
+        """
+        return {
+            "com.jfrog.artifactory.migrated-from": str(source_path),
+            "com.jfrog.artifactory.migrated-at": datetime.datetime.now().isoformat(),
+        }
 
     async def migrate_from_bind_mount(
-        self, source_path: Path, target_volume: str, volume_type: VolumeType
+        self,
+        source_path: Path,
+        target_volume: str,
+        volume_type: VolumeType,
+        hardlink: bool = False,
     ) -> bool:
         """Migrate data from a bind mount to a Docker volume.
 
+        The target volume should be created with migration_labels() so it
+        records where its data came from.
+
         Args:
             source_path: Path to the bind mount
             target_volume: Target volume name
             volume_type: Type of volume
+            hardlink: Hard-link files into the volume instead of copying them
+                when it lives on the same filesystem as the source. Linked
+                files share their contents with the source, so in-place
+                writes through either path show up in both
 
         Returns:
             bool: True if migration was successful
@@ -804,48 +1235,11 @@ class VolumeManager:
             task = progress.add_task(f"Migrating to {target_volume}...", total=None)
 
             try:
-                # Create a temporary container to copy data from host to volume
-                self._run_command(
-                    [
-                        "docker",
-                        "run",
-                        "--rm",
-                        "-v",
-                        f"{target_volume}:/target",
-                        "-v",
-                        f"{source_path.absolute()}:/source",
-                        "alpine",
-                        "sh",
-                        "-c",
-                        "cp -a /source/. /target/",
-                    ]
+                # Copy in a worker thread so other tasks keep running
+                await asyncio.to_thread(
+                    self._copy_from_path, source_path, target_volume, hardlink
                 )
 
-                # Update volume labels to indicate migration source
-                labels = {
-                    "com.jfrog.artifactory.migrated-from": str(source_path),
-                    "com.jfrog.artifactory.migrated-at": datetime.datetime.now().isoformat(),
-                }
-
-                # Apply labels to volume
-                for key, value in labels.items():
-                    try:
-                        self._run_command(
-                            [
-                                "docker",
-                                "volume",
-                                "label",
-                                "add",
-                                target_volume,
-                                f"{key}={value}",
-                            ],
-                            check=False,
-                        )
-                    except Exception:
-                        # Docker volume label is not supported in older Docker versions, so ignore errors
-                        # This is acceptable as label adding is optional metadata enhancement
-                        pass  # nosec B110
-
                 progress.update(
                     task,
                     completed=100,
@@ -861,6 +1255,93 @@ class VolumeManager:
                 self.console.print(f"[bold red]Failed to migrate data:[/] {e}")
                 return False
 
+    def _copy_from_path(
+        self, source_path: Path, target_volume: str, hardlink: bool
+    ) -> None:
+        """Copy or hard-link a host directory's contents into a volume.
+
+        Args:
+            source_path: Directory to copy from
+            target_volume: Target volume name
+            hardlink: Hard-link files when the volume is on the same filesystem
+
+        Raises:
+            OSError: If hard-linking fails
+            subprocess.CalledProcessError: If the copy container fails
+        """
+        mountpoint = self._link_target(source_path, target_volume) if hardlink else None
+        if mountpoint:
+            self._link_tree(source_path, mountpoint)
+            return
+
+        if hardlink:
+            self.console.print(
+                f"[yellow]{target_volume} is not on the same filesystem "
+                "as the source, copying instead of hard-linking[/]"
+            )
+        # Create a temporary container to copy data from host to volume
+        self._run_command(
+            [
+                "docker",
+                "run",
+                "--rm",
+                "-v",
+                f"{target_volume}:/target",
+                "-v",
+                f"{source_path.absolute()}:/source",
+                "alpine",
+                "sh",
+                "-c",
+                "cp -a /source/. /target/",
+            ],
+            discard_output=True,
+        )
+
+    def _link_target(self, source_path: Path, volume_name: str) -> Path | None:
+        """Get a volume's mountpoint if files can be hard-linked into it.
+
+        Args:
+            source_path: Directory the files would be linked from
+            volume_name: Name of the target volume
+
+        Returns:
+            Optional[Path]: Writable mountpoint on the same filesystem as
+            source_path, or None
+        """
+        volume_info = self.get_volume_info(volume_name)
+        mountpoint = _host_mountpoint(volume_info) if volume_info else None
+        if mountpoint is None or not os.access(mountpoint, os.W_OK):
+            return None
+        if os.stat(source_path).st_dev != os.stat(mountpoint).st_dev:
+            return None
+        return mountpoint
+
+    @staticmethod
+    def _link_tree(source_path: Path, target: Path) -> None:
+        """Recreate a directory tree with hard links to the source files.
+
+        Directories are created with the source's mode and ownership, as
+        ``cp -a`` would, so the container user can still write to them.
+
+        Args:
+            source_path: Directory to link from
+            target: Existing directory to link into
+
+        Raises:
+            OSError: If a link or directory cannot be created
+        """
+        shutil.copytree(
+            source_path,
+            target,
+            symlinks=True,
+            copy_function=os.link,
+            dirs_exist_ok=True,
+        )
+        for dirpath, _, _ in os.walk(source_path):
+            info = os.stat(dirpath)
+            relative = os.path.relpath(dirpath, source_path)
+            os.chown(target / relative, info.st_uid, info.st_gid)
+
     def analyze_data_usage(self, volume_name: str) -> dict[str, Any]:
         """Analyze the data usage within a volume.
 
@@ -876,7 +1357,8 @@ class VolumeManager:
         self.console.print(f"[bold]Analyzing data usage in volume {volume_name}...[/]")
 
         try:
-            # Run du command in container to get directory sizes
+            # Run du command in container to get directory sizes, plus the
+            # total in bytes so no second container is needed for it
             result = self._run_command(
                 [
                     "docker",
@@ -887,24 +1369,29 @@ class VolumeManager:
                     "alpine",
                     "sh",
                     "-c",
-                    "du -sh /volume/* /volume/.[!.]* 2>/dev/null || true",
+                    "du -sh /volume/* /volume/.[!.]* 2>/dev/null; "
+                    "du -sb /volume 2>/dev/null; true",
                 ]
             )
 
-            # Parse the results
+            # Parse lines like "4.0K\t/volume/etc"; only split off the size so
+            # names containing spaces stay whole
             usage_data = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    size, path = parts[0], parts[1]
-                    path_name = Path(path).name
+            total_size_info = None
+            for line in result.stdout.splitlines():
+                parts = line.split(None, 1)
+                if len(parts) == 2:
+                    size, path = parts
+                    path = path.rstrip()
+                    if path == "/volume":
+                        total_size_info = _format_size(int(size))
+                        continue
+                    path_name = path.rsplit("/", 1)[-1]
                     usage_data.append({"path": path_name, "size": size})
 
             # Get total size
-            total_size_info = self.get_volume_size(volume_name)
+            if total_size_info is None:
+                total_size_info = self.get_volume_size(volume_name)
             total_size = total_size_info[1] if total_size_info else "Unknown"
 
             # Display results
@@ -3,10 +3,51 @@
 This module provides functionality for rendering templates for various configuration files.
 """
 
+import functools
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """Get an on-disk cache for compiled templates, shared between runs.
+
+    Jinja's default location is a per-user directory in the system temp dir
+    that it creates with owner-only permissions and refuses to use otherwise.
+
+    Returns:
+        Optional[BytecodeCache]: Bytecode cache, or None if no safe cache
+        directory is available
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_environment(module_path: Path) -> Environment:
+    """Get the Jinja environment for a template directory.
+
+    Environments are reused so each template is compiled once per process
+    rather than on every render, and compiled templates are kept on disk so
+    later runs skip compiling unchanged templates.
+
+    Args:
+        module_path: Directory containing the templates
+
+    Returns:
+        Environment: Jinja environment loading from module_path
+    """
+    # Autoescape would break Docker Compose and shell script generation
+    return Environment(  # nosec B701
+        loader=FileSystemLoader(module_path),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
+    )
 
 
 def render_template_from_file(
@@ -35,16 +76,8 @@ def render_template_from_file(
     else:
         module_path = template_path
 
-    # Create Jinja environment
-    # Autoescape would break Docker Compose and shell script generation
-    env = Environment(  # nosec B701
-        loader=FileSystemLoader(module_path),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
-    # Get the template
-    template = env.get_template(template_name)
+    # Get the template, compiled at most once per environment
+    template = _get_environment(module_path).get_template(template_name)
     rendered = template.render(**context)
 
     if output_path:
@@ -1,16 +1,35 @@
 """Base validator interface for configuration validation."""
 
+import functools
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 
+@functools.lru_cache(maxsize=256)
+def _split_path(key_path: str) -> tuple[str, ...]:
+    """Split a dot-separated key path, reusing earlier splits.
+
+    Validators look up the same constant key paths on every run.
+
+    Args:
+        key_path: Dot-separated key path
+
+    Returns:
+        Tuple of the path's keys
+    """
+    return tuple(key_path.split("."))
+
+
 @dataclass
 class ValidationResult:
     """Result of configuration validation."""
 
     errors: list[str]
     warnings: list[str]
+    # Offending key paths behind an aggregated error, by the key it names
+    details: dict[str, list[str]] = field(default_factory=dict)
 
     @property
     def is_valid(self) -> bool:
@@ -51,7 +70,7 @@ class BaseValidator(ABC):
         Returns:
             True if key exists, False otherwise
         """
-        keys = key_path.split(".")
+        keys = _split_path(key_path)
         current = config
 
         for key in keys:
@@ -62,24 +81,27 @@ class BaseValidator(ABC):
 
         return True
 
-    def _get_value(self, config: dict[str, Any], key_path: str) -> Any | None:
+    def _get_value(
+        self, config: dict[str, Any], key_path: str, default: Any = None
+    ) -> Any | None:
         """Get value from nested key path.
 
         Args:
             config: Configuration dictionary
             key_path: Dot-separated key path
+            default: Value to return when the key does not exist
 
         Returns:
-            Value if exists, None otherwise
+            Value if exists, default otherwise
         """
-        keys = key_path.split(".")
+        keys = _split_path(key_path)
         current = config
 
         for key in keys:
             if isinstance(current, dict) and key in current:
                 current = current[key]
             else:
-                return None
+                return default
 
         return current
 
@@ -97,16 +119,28 @@ class BaseValidator(ABC):
         Returns:
             List of all key paths in dot notation
         """
-        keys: list[str] = []
+        return list(self._iter_keys_recursive(config, prefix))
 
+    def _iter_keys_recursive(
+        self,
+        config: dict[str, Any] | str | int | float | bool | None,
+        prefix: str = "",
+    ) -> Iterator[str]:
+        """Recursively yield all keys in configuration, parents first.
+
+        Args:
+            config: Configuration dictionary (or other simple value)
+            prefix: Current key prefix
+
+        Yields:
+            Each key path in dot notation
+        """
         if not isinstance(config, dict):
-            return keys
+            return
 
         for key, value in config.items():
             full_key = f"{prefix}.{key}" if prefix else key
-            keys.append(full_key)
+            yield full_key
 
             if isinstance(value, dict):
-                keys.extend(self._find_keys_recursive(value, full_key))
-
-        return keys
+                yield from self._iter_keys_recursive(value, full_key)
@@ -1,9 +1,17 @@
 """Validator for Artifactory OSS configuration."""
 
+import re
 from typing import Any
 
 from .base import BaseValidator, ValidationResult
 
+# Join keys look like "prefix.algorithm.encryptedValue": three or more
+# non-empty dot-separated parts
+_JOIN_KEY_PATTERN = re.compile(r"[^.]+(?:\.[^.]+){2,}")
+
+# Marks keys absent from the config, as opposed to keys set to null
+_MISSING = object()
+
 
 class ArtifactoryOSSValidator(BaseValidator):
     """Validates system.yaml for OSS compatibility."""
@@ -67,32 +75,37 @@ class ArtifactoryOSSValidator(BaseValidator):
         self, config: dict[str, Any], result: ValidationResult
     ) -> None:
         """Check for keys that are invalid in OSS version."""
-        all_keys = set(self._find_keys_recursive(config))
-
         for invalid_key in self.INVALID_OSS_KEYS:
-            # Check both exact match and prefix match
-            matching_keys = [
-                key
-                for key in all_keys
-                if key == invalid_key or key.startswith(f"{invalid_key}.")
-            ]
-
-            for key in matching_keys:
-                result.add_error(
-                    f"Key '{key}' is not supported in OSS version. "
-                    "This key is only available in Pro/Enterprise editions."
-                )
+            # Look each invalid key up directly and only walk the subtree
+            # under it, instead of listing every key in the config
+            if not self._key_exists(config, invalid_key):
+                continue
+
+            # Report the whole subtree as one error, listing its keys in details
+            subtree = self._get_value(config, invalid_key)
+            nested_keys = list(self._iter_keys_recursive(subtree, invalid_key))
+            result.details[invalid_key] = [invalid_key, *nested_keys]
+
+            key_description = f"Key '{invalid_key}'"
+            if nested_keys:
+                plural = "s" if len(nested_keys) > 1 else ""
+                key_description += f" (and {len(nested_keys)} nested key{plural})"
+            result.add_error(
+                f"{key_description} is not supported in OSS version. "
+                "This key is only available in Pro/Enterprise editions."
+            )
 
     def _check_required_keys(
         self, config: dict[str, Any], result: ValidationResult
     ) -> None:
         """Check that all required keys are present."""
         for key_path, expected_types in self.REQUIRED_KEYS.items():
-            if not self._key_exists(config, key_path):
+            # One lookup tells missing keys apart from present ones (even null)
+            value = self._get_value(config, key_path, _MISSING)
+            if value is _MISSING:
                 result.add_error(f"Required key '{key_path}' is missing")
             else:
                 # Validate type
-                value = self._get_value(config, key_path)
                 if value is not None and not isinstance(value, expected_types):
                     if isinstance(expected_types, tuple):
                         type_names = " or ".join(t.__name__ for t in expected_types)
@@ -159,6 +172,4 @@ class ArtifactoryOSSValidator(BaseValidator):
         if not isinstance(join_key, str):
             return False
 
-        # Join key should have format: prefix.algorithm.encryptedValue
-        parts = join_key.split(".")
-        return len(parts) >= 3 and all(part for part in parts)
+        return _JOIN_KEY_PATTERN.fullmatch(join_key) is not None
@@ -1,5 +1,8 @@
 """File size formatting utilities."""
 
+# Units by power of 1024; sizes under 1 KB are still shown in KB
+_UNITS = ("KB", "MB", "GB")
+
 
 def format_size(size_bytes: int) -> str:
     """
@@ -20,9 +23,7 @@ def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0.00 KB"
 
-    if size_bytes >= 1024 * 1024 * 1024:  # >= 1GB
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-    elif size_bytes >= 1024 * 1024:  # >= 1MB
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:  # < 1MB
-        return f"{size_bytes / 1024:.2f} KB"
+    # Largest power of 1024 the size reaches, counted in 10-bit steps (int()
+    # keeps the thresholds exact for float sizes too)
+    power = min(len(_UNITS), max(1, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (power * 10)):.2f} {_UNITS[power - 1]}"
@@ -7,6 +7,7 @@ import pytest
 from typer.testing import CliRunner
 
 from sapo.cli.cli import app
+from sapo.cli.install_mode.common import OperationStatus
 
 # Create a test runner
 runner = CliRunner()
@@ -33,6 +34,18 @@ def test_install_docker_command_basic():
         assert args["start"] is True  # Updated to match new Docker default
 
 
+def test_install_docker_command_failure_exit_code():
+    """Test that a failed Docker installation exits with a non-zero code."""
+    with mock.patch(
+        "sapo.cli.cli.install_docker_sync", return_value=OperationStatus.ERROR
+    ):
+        result = runner.invoke(
+            app, ["install", "--mode", "docker", "--version", "7.111.4"]
+        )
+
+        assert result.exit_code == 1
+
+
 def test_install_docker_command_with_start():
     """Test Docker installation with explicit start flag."""
     with mock.patch(
@@ -112,7 +112,7 @@ class TestDockerTemplates:
         }
 
         # Mock the template rendering
-        with mock.patch("sapo.cli.install_mode.templates.Environment") as mock_env:
+        with mock.patch("sapo.cli.install_mode.templates._get_environment") as mock_env:
             mock_template = mock.MagicMock()
             mock_template.render.return_value = "MOCKED_ENV_CONTENT"
             mock_env_instance = mock.MagicMock()
@@ -164,11 +164,11 @@ class TestDockerTemplates:
 
 @pytest.mark.asyncio
 @mock.patch("asyncio.sleep")
-@mock.patch("subprocess.Popen")
+@mock.patch("asyncio.create_subprocess_exec", new_callable=mock.AsyncMock)
 @mock.patch("shutil.which", return_value="/usr/bin/docker")
 @mock.patch("subprocess.run")
 async def test_run_docker_compose(
-    mock_run, mock_which, mock_popen, mock_sleep, temp_data_dir
+    mock_run, mock_which, mock_exec, mock_sleep, temp_data_dir
 ):
     """Test running docker compose."""
     # Configure mock for docker --version
@@ -187,9 +187,11 @@ async def test_run_docker_compose(
 
     # Configure mock for docker compose up
     process_mock = mock.MagicMock()
-    process_mock.stdout.readline.side_effect = ["Starting containers...", ""]
-    process_mock.poll.return_value = 0
-    mock_popen.return_value = process_mock
+    process_mock.stdout.readline = mock.AsyncMock(
+        side_effect=[b"Starting containers...\n", b""]
+    )
+    process_mock.wait = mock.AsyncMock(return_value=0)
+    mock_exec.return_value = process_mock
 
     # Mock the asyncio.sleep function to immediately return
     future = asyncio.Future()
@@ -207,14 +209,55 @@ async def test_run_docker_compose(
     assert result is True
 
     # Check that docker and docker compose commands were called
-    assert mock_popen.call_count == 1
+    assert mock_exec.call_count == 1
 
     # Check command arguments
-    docker_compose_call = mock_popen.call_args
-    assert docker_compose_call[0][0][0:2] == ["docker", "compose"]
+    docker_compose_call = mock_exec.call_args
+    assert docker_compose_call[0][0:2] == ("docker", "compose")
     assert docker_compose_call[1]["cwd"] == temp_data_dir
 
 
+def test_render_template_reuses_environment(tmp_path):
+    """Test that templates are compiled once per template directory."""
+    (tmp_path / "greeting.j2").write_text("Hello {{ name }}")
+
+    get_source = jinja2.FileSystemLoader.get_source
+    with mock.patch.object(
+        jinja2.FileSystemLoader, "get_source", autospec=True, side_effect=get_source
+    ) as mock_get_source:
+        first = render_template_from_file(tmp_path, "greeting.j2", {"name": "a"})
+        second = render_template_from_file(tmp_path, "greeting.j2", {"name": "b"})
+
+    assert (first, second) == ("Hello a", "Hello b")
+    assert mock_get_source.call_count == 1
+
+
+def test_render_template_uses_bytecode_cache(tmp_path):
+    """Test that compiled templates are stored in an on-disk bytecode cache."""
+    (tmp_path / "greeting.j2").write_text("Hello {{ name }}")
+
+    with mock.patch.object(
+        jinja2.FileSystemBytecodeCache, "dump_bytecode", autospec=True
+    ) as mock_dump:
+        result = render_template_from_file(tmp_path, "greeting.j2", {"name": "a"})
+
+    assert result == "Hello a"
+    mock_dump.assert_called_once()
+
+
+def test_render_template_without_bytecode_cache(tmp_path):
+    """Test that rendering works when no safe cache directory is available."""
+    (tmp_path / "greeting.j2").write_text("Hello {{ name }}")
+
+    with mock.patch(
+        "sapo.cli.install_mode.templates.FileSystemBytecodeCache",
+        side_effect=RuntimeError("Cannot determine safe temp directory."),
+    ):
+        result = render_template_from_file(tmp_path, "greeting.j2", {"name": "a"})
+
+    assert result == "Hello a"
+
+
 def test_docker_command_exists():
     """Test that Docker is installed for integration tests."""
     # This test helps identify if Docker is available for integration tests
@@ -4,7 +4,12 @@ import re
 import tempfile
 from pathlib import Path
 
-from sapo.cli.install_mode.docker.config import DatabaseType, DockerConfig
+from sapo.cli.install_mode.docker.config import (
+    DatabaseType,
+    DockerConfig,
+    _random_bytes,
+    _random_chars,
+)
 
 
 class TestDockerConfig:
@@ -231,6 +236,34 @@ class TestDockerConfigSecurity:
             for char in dangerous_chars:
                 assert char not in password, f"Password contains dangerous char: {char}"
 
+    def test_password_cache_is_per_instance(self):
+        """Test that each config keeps its own password cache."""
+        config1 = DockerConfig(version="7.111.4")
+        config2 = DockerConfig(version="7.111.4")
+
+        assert config1.generate_password("postgres") != config2.generate_password(
+            "postgres"
+        )
+        assert config1._passwords is not config2._passwords
+
+    def test_random_chars_stay_within_alphabet(self):
+        """Test that bulk character draws only use the given alphabet."""
+        alphabet = b"abc!"
+
+        chars = _random_chars(alphabet, 64)
+
+        assert len(chars) == 64
+        assert set(chars) <= set(alphabet.decode())
+
+    def test_random_bytes_are_not_reused(self):
+        """Test that pooled random bytes are handed out only once."""
+        first = _random_bytes(16)
+        second = _random_bytes(16)
+
+        assert len(first) == 16
+        assert len(second) == 16
+        assert first != second
+
     def test_password_uniqueness_across_keys(self):
         """Test that different keys generate different passwords."""
         config = DockerConfig(version="7.111.4")
@@ -1,5 +1,6 @@
 """Tests for Docker container management."""
 
+import asyncio
 import subprocess
 import tempfile
 from pathlib import Path
@@ -41,16 +42,11 @@ class TestDockerContainerManager:
         assert manager.compose_dir == temp_compose_dir
         assert manager.console == mock_console
 
-    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
-    def test_is_docker_available(self, mock_run, temp_compose_dir, mock_console):
+    @mock.patch("sapo.cli.install_mode.docker.container.shutil.which")
+    def test_is_docker_available(self, mock_which, temp_compose_dir, mock_console):
         """Test checking if Docker is available."""
         # Setup mock
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=["docker", "--version"],
-            returncode=0,
-            stdout="Docker version 20.10.23",
-            stderr="",
-        )
+        mock_which.return_value = "/usr/bin/docker"
 
         # Create manager
         manager = DockerContainerManager(temp_compose_dir, mock_console)
@@ -60,12 +56,15 @@ class TestDockerContainerManager:
 
         # Verify result
         assert result is True
-        mock_run.assert_called_once_with(
-            ["docker", "--version"], check=True, capture_output=True
-        )
+        mock_which.assert_called_once_with("docker")
+
+        # The result is reused for the lifetime of the manager
+        assert manager.is_docker_available() is True
+        mock_which.assert_called_once()
 
         # Now test when Docker is not available
-        mock_run.side_effect = subprocess.SubprocessError("Command failed")
+        mock_which.return_value = None
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
         result = manager.is_docker_available()
         assert result is False
 
@@ -90,7 +89,7 @@ class TestDockerContainerManager:
 
         # Verify result
         assert result is True
-        assert mock_run.call_count >= 3  # compose down + rm commands (network optional)
+        assert mock_run.call_count == 2  # compose down + one batched rm
 
         # Check docker compose down was called - just check the command structure
         docker_compose_call = mock_run.call_args_list[0]
@@ -102,6 +101,10 @@ class TestDockerContainerManager:
         assert "--remove-orphans" in called_cmd
         assert docker_compose_call[1]["cwd"] == temp_compose_dir
 
+        # Both containers are removed with a single docker rm
+        rm_cmd = mock_run.call_args_list[1][0][0]
+        assert rm_cmd == ["docker", "rm", "-f", "artifactory", "artifactory-postgres"]
+
         # Verify console message
         mock_console.print.assert_any_call(
             "[green]Successfully cleaned up Docker Compose environment.[/]"
@@ -125,15 +128,9 @@ class TestDockerContainerManager:
                 stdout="",
                 stderr="Error",
             ),
-            # rm commands succeed
-            subprocess.CompletedProcess(
-                args=["docker", "rm", "-f", "artifactory"],
-                returncode=0,
-                stdout="",
-                stderr="",
-            ),
+            # batched rm succeeds
             subprocess.CompletedProcess(
-                args=["docker", "rm", "-f", "artifactory-postgres"],
+                args=["docker", "rm", "-f", "artifactory", "artifactory-postgres"],
                 returncode=0,
                 stdout="",
                 stderr="",
@@ -163,14 +160,17 @@ class TestDockerContainerManager:
     @pytest.mark.asyncio
     @mock.patch("shutil.which", return_value="/usr/bin/docker")
     @mock.patch("sapo.cli.install_mode.docker.container.subprocess.run")
-    @mock.patch("sapo.cli.install_mode.docker.container.subprocess.Popen")
+    @mock.patch(
+        "sapo.cli.install_mode.docker.container.asyncio.create_subprocess_exec",
+        new_callable=mock.AsyncMock,
+    )
     @mock.patch(
         "sapo.cli.install_mode.docker.container.DockerContainerManager.is_docker_available"
     )
     async def test_start_containers(
         self,
         mock_is_docker,
-        mock_popen,
+        mock_exec,
         mock_run,
         mock_which,
         temp_compose_dir,
@@ -190,9 +190,11 @@ class TestDockerContainerManager:
 
         # Mock process for docker compose up
         mock_process = mock.MagicMock()
-        mock_process.stdout.readline.side_effect = ["Starting containers...", ""]
-        mock_process.poll.return_value = 0
-        mock_popen.return_value = mock_process
+        mock_process.stdout.readline = mock.AsyncMock(
+            side_effect=[b"Starting containers...\n", b""]
+        )
+        mock_process.wait = mock.AsyncMock(return_value=0)
+        mock_exec.return_value = mock_process
 
         # Create manager
         manager = DockerContainerManager(temp_compose_dir, mock_console)
@@ -208,9 +210,10 @@ class TestDockerContainerManager:
         assert result is True
 
         # Check docker compose up was called
-        mock_popen.assert_called_once()
-        cmd = mock_popen.call_args[0][0]
+        mock_exec.assert_called_once()
+        cmd = list(mock_exec.call_args[0])
         assert cmd[:3] == ["docker", "compose", "up"]
+        assert "--quiet-pull" in cmd
 
         # Verify wait_for_health was called
         manager.wait_for_health.assert_called_once()
@@ -220,17 +223,49 @@ class TestDockerContainerManager:
             f"[bold blue]Starting Artifactory with Docker Compose in {temp_compose_dir}...[/]"
         )
 
+    @pytest.mark.asyncio
+    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
+    @mock.patch(
+        "sapo.cli.install_mode.docker.container.asyncio.create_subprocess_exec",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "sapo.cli.install_mode.docker.container.DockerContainerManager.is_docker_available",
+        return_value=True,
+    )
+    async def test_start_containers_known_port(
+        self, mock_is_docker, mock_exec, mock_run, temp_compose_dir, mock_console
+    ):
+        """Test that a known port is reported without querying Docker."""
+        mock_process = mock.MagicMock()
+        mock_process.stdout.readline = mock.AsyncMock(return_value=b"")
+        mock_process.wait = mock.AsyncMock(return_value=0)
+        mock_exec.return_value = mock_process
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console, port=8083)
+        manager.wait_for_health = mock.AsyncMock(return_value=True)
+
+        assert await manager.start_containers() is True
+
+        mock_run.assert_not_called()
+        mock_console.print.assert_any_call(
+            "[bold green]Artifactory is now running![/] Access at http://localhost:8083"
+        )
+
     @pytest.mark.asyncio
     @mock.patch("shutil.which", return_value="/usr/bin/docker")
     @mock.patch("sapo.cli.install_mode.docker.container.subprocess.run")
-    @mock.patch("sapo.cli.install_mode.docker.container.subprocess.Popen")
+    @mock.patch(
+        "sapo.cli.install_mode.docker.container.asyncio.create_subprocess_exec",
+        new_callable=mock.AsyncMock,
+    )
     @mock.patch(
         "sapo.cli.install_mode.docker.container.DockerContainerManager.is_docker_available"
     )
     async def test_start_containers_failure(
         self,
         mock_is_docker,
-        mock_popen,
+        mock_exec,
         mock_run,
         mock_which,
         temp_compose_dir,
@@ -247,9 +282,11 @@ class TestDockerContainerManager:
 
         # Mock process for docker compose up with failure
         mock_process = mock.MagicMock()
-        mock_process.stdout.readline.side_effect = ["Error: failed to start", ""]
-        mock_process.poll.return_value = 1
-        mock_popen.return_value = mock_process
+        mock_process.stdout.readline = mock.AsyncMock(
+            side_effect=[b"Error: failed to start\n", b""]
+        )
+        mock_process.wait = mock.AsyncMock(return_value=1)
+        mock_exec.return_value = mock_process
 
         # Create manager
         manager = DockerContainerManager(temp_compose_dir, mock_console)
@@ -314,10 +351,12 @@ class TestDockerContainerManager:
         assert manager.get_container_status("container4") == ContainerStatus.UNKNOWN
 
     @pytest.mark.asyncio
-    @mock.patch("sapo.cli.install_mode.docker.container.asyncio.sleep")
-    async def test_wait_for_health(self, mock_sleep, temp_compose_dir, mock_console):
+    @mock.patch.object(DockerContainerManager, "_watch_container_events")
+    @mock.patch.object(DockerContainerManager, "_wait_for_change")
+    async def test_wait_for_health(
+        self, mock_wait, mock_watch, temp_compose_dir, mock_console
+    ):
         """Test waiting for container health."""
-        # Create manager with a mocked get_container_status
         manager = DockerContainerManager(temp_compose_dir, mock_console)
 
         # Create a sequence of statuses to return
@@ -327,35 +366,259 @@ class TestDockerContainerManager:
             (ContainerStatus.RUNNING, ContainerStatus.RUNNING),  # Second check
             (ContainerStatus.HEALTHY, ContainerStatus.RUNNING),  # Third check
         ]
-
-        # Mock the get_container_status method
-        original_get_status = manager.get_container_status
-
         status_iter = iter(status_sequence)
 
-        def mock_get_status(container_name):
-            try:
-                current_statuses = next(status_iter)
-                return current_statuses[0 if container_name == "artifactory" else 1]
-            except StopIteration:
-                # After we run out of sequence items, return HEALTHY
-                return ContainerStatus.HEALTHY
-
-        # Apply the mock
-        manager.get_container_status = mock_get_status
+        def mock_get_statuses(container_names):
+            # After we run out of sequence items, report everything healthy
+            art, pg = next(
+                status_iter, (ContainerStatus.HEALTHY, ContainerStatus.HEALTHY)
+            )
+            return {"artifactory": art, "artifactory-postgres": pg}
 
-        try:
+        with mock.patch.object(
+            manager, "get_container_statuses", side_effect=mock_get_statuses
+        ) as mock_statuses:
             # Wait for health
             result = await manager.wait_for_health(interval=1)
 
-            # Verify result
-            assert result is True
+        # Verify result: ready on the second check, after one short wait
+        assert result is True
+        mock_wait.assert_called_once_with(mock.ANY, 0.5)
+        mock_watch.assert_called_once_with(
+            ["artifactory", "artifactory-postgres"], mock.ANY
+        )
+
+        # Both containers are checked with one call per attempt
+        assert mock_statuses.call_count == 2
+        mock_statuses.assert_called_with(["artifactory", "artifactory-postgres"])
+
+    @pytest.mark.asyncio
+    @mock.patch.object(DockerContainerManager, "_watch_container_events")
+    @mock.patch.object(DockerContainerManager, "_wait_for_change")
+    async def test_wait_for_health_backoff_and_timeout(
+        self, mock_wait, mock_watch, temp_compose_dir, mock_console
+    ):
+        """Test that polling backs off up to the interval and honours the timeout."""
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        unknown = {
+            "artifactory": ContainerStatus.UNKNOWN,
+            "artifactory-postgres": ContainerStatus.UNKNOWN,
+        }
+        # Fake clock that only moves when the health loop waits
+        now = [0.0]
+        manager.clock = lambda: now[0]
+
+        async def fake_wait(changed, timeout):
+            now[0] += timeout
+
+        mock_wait.side_effect = fake_wait
+
+        with mock.patch.object(manager, "get_container_statuses", return_value=unknown):
+            result = await manager.wait_for_health(timeout=3, interval=1)
+
+        assert result is False
+        delays = [call.args[1] for call in mock_wait.call_args_list]
+        assert delays == [0.5, 0.75, 1, 0.75]
+
+    @pytest.mark.asyncio
+    @mock.patch.object(DockerContainerManager, "_watch_container_events")
+    async def test_wait_for_health_closes_api_client(
+        self, mock_watch, temp_compose_dir, mock_console
+    ):
+        """Test that the Engine API client is closed once polling finishes."""
+        client = mock.MagicMock()
+        client.api.inspect_container.return_value = {
+            "State": {"Status": "running", "Health": {"Status": "healthy"}}
+        }
 
-            # Verify sleep was called at least 3 times (minimum attempts)
-            assert mock_sleep.call_count >= 3
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        with mock.patch("docker.from_env", return_value=client):
+            result = await manager.wait_for_health()
+
+        assert result is True
+        client.close.assert_called_once()
+        assert manager._api_client is None
+        assert manager._api_client_checked is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_health_wakes_on_container_event(
+        self, temp_compose_dir, mock_console
+    ):
+        """Test that a container event triggers a re-check before the interval."""
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        statuses = iter(
+            [
+                {
+                    "artifactory": ContainerStatus.UNKNOWN,
+                    "artifactory-postgres": ContainerStatus.UNKNOWN,
+                },
+                {
+                    "artifactory": ContainerStatus.HEALTHY,
+                    "artifactory-postgres": ContainerStatus.HEALTHY,
+                },
+            ]
+        )
+
+        async def watch(container_names, changed):
+            # Report a health_status event shortly after polling starts
+            await asyncio.sleep(0.01)
+            changed.set()
+            await asyncio.Event().wait()
+
+        with (
+            mock.patch.object(
+                manager, "get_container_statuses", side_effect=lambda n: next(statuses)
+            ),
+            mock.patch.object(manager, "_watch_container_events", side_effect=watch),
+        ):
+            result = await asyncio.wait_for(
+                manager.wait_for_health(timeout=60, initial_interval=30), 5
+            )
+
+        assert result is True
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.create_subprocess_exec", new_callable=mock.AsyncMock)
+    async def test_watch_container_events(
+        self, mock_exec, temp_compose_dir, mock_console
+    ):
+        """Test that each docker events line signals a change."""
+        process = mock.MagicMock()
+        process.returncode = None
+        process.stdout.readline = mock.AsyncMock(
+            side_effect=[b"artifactory health_status: healthy\n", b""]
+        )
+        process.wait = mock.AsyncMock(return_value=0)
+        mock_exec.return_value = process
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        changed = asyncio.Event()
+        await manager._watch_container_events(["artifactory"], changed)
+
+        assert changed.is_set()
+        cmd = mock_exec.call_args.args
+        assert cmd[:2] == ("docker", "events")
+        assert "container=artifactory" in cmd
+        assert "event=health_status" in cmd
+        process.kill.assert_called_once()
+
+    @mock.patch.object(DockerContainerManager, "_get_api_client", return_value=None)
+    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
+    def test_get_container_statuses(
+        self, mock_run, mock_client, temp_compose_dir, mock_console
+    ):
+        """Test reading several container statuses with one inspect call."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["docker", "inspect"],
+            returncode=1,
+            stdout="/artifactory running healthy\n/artifactory-postgres exited \n",
+            stderr="Error: No such object: missing",
+        )
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        statuses = manager.get_container_statuses(
+            ["artifactory", "artifactory-postgres", "missing"]
+        )
+
+        assert statuses == {
+            "artifactory": ContainerStatus.HEALTHY,
+            "artifactory-postgres": ContainerStatus.STOPPED,
+            "missing": ContainerStatus.UNKNOWN,
+        }
+        mock_run.assert_called_once()
+
+    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
+    def test_get_container_statuses_via_api(
+        self, mock_run, temp_compose_dir, mock_console
+    ):
+        """Test that statuses come from the Engine API when it is reachable."""
+        from docker.errors import NotFound
+
+        states = {
+            "artifactory": {"State": {"Status": "running", "Health": None}},
+            "artifactory-postgres": {
+                "State": {"Status": "running", "Health": {"Status": "healthy"}}
+            },
+        }
+
+        def inspect_container(name):
+            if name not in states:
+                raise NotFound(f"No such container: {name}")
+            return states[name]
+
+        client = mock.MagicMock()
+        client.api.inspect_container.side_effect = inspect_container
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        with mock.patch("docker.from_env", return_value=client) as mock_from_env:
+            for _ in range(2):
+                statuses = manager.get_container_statuses(
+                    ["artifactory", "artifactory-postgres", "missing"]
+                )
+
+        assert statuses == {
+            "artifactory": ContainerStatus.RUNNING,
+            "artifactory-postgres": ContainerStatus.HEALTHY,
+            "missing": ContainerStatus.UNKNOWN,
+        }
+        mock_from_env.assert_called_once()
+        mock_run.assert_not_called()
+
+    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
+    def test_get_container_statuses_falls_back_on_connection_error(
+        self, mock_run, temp_compose_dir, mock_console
+    ):
+        """Test that a lost daemon connection falls back to the CLI."""
+        import requests
+
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["docker", "inspect"],
+            returncode=0,
+            stdout="/artifactory running healthy\n",
+        )
+        client = mock.MagicMock()
+        client.api.inspect_container.side_effect = requests.ConnectionError(
+            "Connection aborted"
+        )
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        with mock.patch("docker.from_env", return_value=client):
+            statuses = manager.get_container_statuses(["artifactory"])
+
+        assert statuses == {"artifactory": ContainerStatus.HEALTHY}
+        mock_run.assert_called_once()
+
+    @mock.patch("sapo.cli.install_mode.docker.container.run_docker_command")
+    def test_get_container_statuses_falls_back_to_cli(
+        self, mock_run, temp_compose_dir, mock_console
+    ):
+        """Test that the CLI is used when the daemon socket is unreachable."""
+        from docker.errors import DockerException
+
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["docker", "inspect"],
+            returncode=0,
+            stdout="/artifactory running healthy\n",
+        )
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
+        with mock.patch("docker.from_env", side_effect=DockerException("no socket")):
+            statuses = manager.get_container_statuses(["artifactory"])
+
+        assert statuses == {"artifactory": ContainerStatus.HEALTHY}
+        mock_run.assert_called_once()
+
+    @mock.patch("shutil.which", return_value="/usr/bin/docker")
+    @mock.patch("sapo.cli.install_mode.docker.container.subprocess.run")
+    def test_get_container_status_single_inspect(
+        self, mock_run, mock_which, temp_compose_dir, mock_console
+    ):
+        """Test that state and health are read with one inspect call."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["docker", "inspect"], returncode=0, stdout="running healthy\n"
+        )
+
+        manager = DockerContainerManager(temp_compose_dir, mock_console)
 
-            # Restore original method
-            manager.get_container_status = original_get_status
-        finally:
-            # Ensure we restore the original method even if test fails
-            manager.get_container_status = original_get_status
+        assert manager.get_container_status("artifactory") == ContainerStatus.HEALTHY
+        mock_run.assert_called_once()
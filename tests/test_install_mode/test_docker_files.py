@@ -141,10 +141,11 @@ class TestDockerFileManager:
             False,
         )
 
+    @mock.patch("sapo.cli.install_mode.docker.files.shutil.copyfile")
     @mock.patch("sapo.cli.install_mode.docker.files.render_template_from_file")
     @mock.patch("sapo.cli.install_mode.docker.files.safe_write_file")
     def test_generate_system_yaml(
-        self, mock_write, mock_render, docker_config, mock_console
+        self, mock_write, mock_render, mock_copy, docker_config, mock_console
     ):
         """Test system.yaml generation."""
         # Setup mocks
@@ -173,17 +174,58 @@ class TestDockerFileManager:
         assert context["joinkey"] == docker_config.joinkey
         assert context["platform"] == platform.system()
 
-        # Verify both files were written (etc dir and output dir)
-        assert mock_write.call_count == 2
-        mock_write.assert_any_call(
+        # Verify the etc copy was written and the output dir copy taken from it
+        mock_write.assert_called_once_with(
             docker_config.data_dir / "etc" / "system.yaml",
             "MOCK_SYSTEM_YAML_CONTENT",
             False,
         )
-        mock_write.assert_any_call(
-            docker_config.output_dir / "system.yaml", "MOCK_SYSTEM_YAML_CONTENT", False
+        mock_copy.assert_called_once_with(
+            docker_config.data_dir / "etc" / "system.yaml",
+            docker_config.output_dir / "system.yaml",
         )
 
+    @mock.patch(
+        "sapo.cli.install_mode.docker.files.render_template_from_file",
+        return_value="shared: {}\n",
+    )
+    def test_system_yaml_reference_copy_matches(
+        self, mock_render, docker_config, mock_console
+    ):
+        """Test that the reference system.yaml has the same content as the main one."""
+        docker_config.output_dir.mkdir(parents=True)
+        ref_path = docker_config.output_dir / "system.yaml"
+        ref_path.write_text("stale")
+
+        manager = DockerFileManager(docker_config, mock_console)
+        result = manager._generate_system_yaml(non_interactive=True)
+
+        assert result.success is True
+        main_path = docker_config.data_dir / "etc" / "system.yaml"
+        assert ref_path.read_text() == main_path.read_text() == "shared: {}\n"
+        # The reference is a snapshot, not another name for the live file
+        assert not ref_path.samefile(main_path)
+
+    @mock.patch(
+        "sapo.cli.install_mode.docker.files.render_template_from_file",
+        return_value="shared: {}\n",
+    )
+    @mock.patch("sapo.cli.install_mode.docker.files.typer.confirm", return_value=False)
+    def test_system_yaml_reference_copy_confirms_overwrite(
+        self, mock_confirm, mock_render, docker_config, mock_console
+    ):
+        """Test that an existing reference system.yaml is kept when the user declines."""
+        docker_config.output_dir.mkdir(parents=True)
+        ref_path = docker_config.output_dir / "system.yaml"
+        ref_path.write_text("stale")
+
+        manager = DockerFileManager(docker_config, mock_console)
+        result = manager._generate_system_yaml()
+
+        assert result.success is True
+        mock_confirm.assert_called_once()
+        assert ref_path.read_text() == "stale"
+
     @mock.patch("sapo.cli.install_mode.docker.files.shutil.rmtree")
     @mock.patch("sapo.cli.install_mode.docker.files.render_template_from_file")
     @mock.patch("sapo.cli.install_mode.docker.files.safe_write_file")
@@ -218,8 +260,8 @@ class TestDockerFileManager:
         # Check that the template was rendered
         mock_render.assert_called_once()
 
-        # Verify both files were written (etc dir and output dir)
-        assert mock_write.call_count == 2
+        # Verify only the etc copy was serialized
+        assert mock_write.call_count == 1
 
     @mock.patch(
         "sapo.cli.install_mode.docker.files.DockerFileManager._generate_env_file"
@@ -272,6 +314,31 @@ class TestDockerFileManager:
         assert FileType.SYSTEM_YAML in results
         assert all(result.success for result in results.values())
 
+    @mock.patch("sapo.cli.install_mode.docker.files.render_template_from_file")
+    @mock.patch("sapo.cli.install_mode.docker.files.safe_write_file")
+    def test_generate_all_files_shares_context(
+        self, mock_write, mock_render, mock_console
+    ):
+        """Test that all templates see the same generated password and join key."""
+        mock_render.return_value = "MOCK_CONTENT"
+        mock_write.return_value.success = True
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = DockerConfig(version="7.111.4", data_dir=Path(tmpdir))
+            manager = DockerFileManager(config, mock_console, use_named_volumes=True)
+
+            with mock.patch.object(
+                manager, "_template_context", wraps=manager._template_context
+            ) as mock_context:
+                manager.generate_all_files(non_interactive=True)
+
+        mock_context.assert_called_once()
+        contexts = [call.args[2] for call in mock_render.call_args_list]
+        assert len(contexts) == 3
+        assert len({ctx["postgres_password"] for ctx in contexts}) == 1
+        assert len({ctx["joinkey"] for ctx in contexts}) == 1
+        assert contexts[0]["joinkey"] == config.joinkey
+
     @mock.patch("sapo.cli.install_mode.docker.files.create_artifactory_structure")
     def test_create_directories(
         self, mock_create_structure, docker_config, mock_console
@@ -1,12 +1,24 @@
 """Tests for Docker installation functionality."""
 
+import _thread
+import asyncio
+import threading
 from pathlib import Path
+from unittest import mock
 
-from sapo.cli.install_mode.docker import DockerConfig
-from sapo.cli.install_mode.docker.config import DatabaseType
+import pytest
+import typer
 
-# NOTE: These private functions are tested indirectly through integration tests
-# Direct unit tests are disabled due to import conflicts between docker.py and docker/ package
+from sapo.cli.install_mode.common import OperationStatus
+from sapo.cli.install_mode.docker import (
+    DockerConfig,
+    VolumeType,
+    _get_loop,
+    _stop_loop,
+    install_docker,
+    install_docker_sync,
+)
+from sapo.cli.install_mode.docker.config import DatabaseType
 
 
 class TestDockerInstall:
@@ -44,3 +56,100 @@ class TestDockerInstall:
         assert config.postgres_user == "custom_user"
         assert config.postgres_db == "custom_db"
         assert config.joinkey == "my_custom_joinkey"
+
+
+class TestInstallDockerVolumes:
+    """Tests for named volume creation during Docker installation."""
+
+    @pytest.mark.asyncio
+    @mock.patch("sapo.cli.install_mode.docker.VolumeManager")
+    async def test_etc_volume_failure_rolls_back_volume_set(
+        self, mock_manager_cls, tmp_path
+    ):
+        """Test that a failed etc volume removes the already created set."""
+        manager = mock_manager_cls.return_value
+        manager.create_volume_set.return_value = {
+            VolumeType.DATA: "artifactory_data_v7_111_4",
+            VolumeType.LOGS: "artifactory_logs_v7_111_4",
+        }
+        manager.create_volume.side_effect = RuntimeError("etc failed")
+
+        with pytest.raises(typer.Exit):
+            await install_docker(
+                version="7.111.4",
+                data_dir=tmp_path,
+                non_interactive=True,
+                use_named_volumes=True,
+            )
+
+        manager.delete_volume.assert_any_call("artifactory_data_v7_111_4", force=True)
+        manager.delete_volume.assert_any_call("artifactory_logs_v7_111_4", force=True)
+
+
+class TestInstallDockerSync:
+    """Tests for the synchronous Docker installation entry point."""
+
+    @mock.patch(
+        "sapo.cli.install_mode.docker.install_docker", new_callable=mock.AsyncMock
+    )
+    def test_reuses_background_loop(self, mock_install):
+        """Test that repeated calls run on the same background event loop."""
+        first = install_docker_sync(version="7.111.4", non_interactive=True)
+        loop = _get_loop()
+        second = install_docker_sync(version="7.111.4", non_interactive=True)
+
+        assert first == OperationStatus.SUCCESS
+        assert second == OperationStatus.SUCCESS
+        assert _get_loop() is loop
+        assert mock_install.await_count == 2
+
+    @mock.patch(
+        "sapo.cli.install_mode.docker.install_docker", new_callable=mock.AsyncMock
+    )
+    def test_reports_installation_errors(self, mock_install):
+        """Test that failures inside the coroutine map to an error status."""
+        mock_install.side_effect = typer.Exit(1)
+
+        assert install_docker_sync(version="7.111.4") == OperationStatus.ERROR
+
+    @mock.patch("sapo.cli.install_mode.docker.typer.confirm", return_value=False)
+    def test_reports_user_cancellation(self, mock_confirm, tmp_path):
+        """Test that declining the confirmation prompt maps to a warning."""
+        result = install_docker_sync(version="7.111.4", destination=tmp_path)
+
+        assert result == OperationStatus.WARNING
+        mock_confirm.assert_called_once()
+
+    def test_interrupt_waits_for_installer_cleanup(self):
+        """Test that Ctrl+C lets the cancelled installer run its cleanup."""
+        cleaned_up = threading.Event()
+
+        async def install(**kwargs):
+            try:
+                # Interrupt the caller once the installer is running
+                threading.Timer(0.05, _thread.interrupt_main).start()
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0.05)
+                cleaned_up.set()
+
+        with mock.patch("sapo.cli.install_mode.docker.install_docker", install):
+            result = install_docker_sync(version="7.111.4", non_interactive=True)
+
+        assert result == OperationStatus.WARNING
+        assert cleaned_up.is_set()
+
+    def test_stop_loop_closes_background_loop(self):
+        """Test that the exit hook shuts the background loop down and closes it."""
+        from sapo.cli.install_mode import docker
+
+        loop = _get_loop()
+        thread = docker._LOOP_THREAD
+        assert thread is not None
+
+        _stop_loop(loop, thread)
+
+        assert loop.is_closed()
+        assert not thread.is_alive()
+        # A new loop is started on the next use
+        assert _get_loop() is not loop
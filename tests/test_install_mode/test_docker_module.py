@@ -4,6 +4,10 @@ import tempfile
 from pathlib import Path
 from unittest import mock
 
+from sapo.cli.install_mode.common import (
+    _docker_installed_bucket,
+    check_docker_installed,
+)
 from sapo.cli.install_mode.common.file_utils import safe_write_file
 from sapo.cli.install_mode.common.system_utils import check_disk_space
 from sapo.cli.install_mode.docker import generate_password
@@ -12,6 +16,13 @@ from sapo.cli.install_mode.docker import generate_password
 class TestDockerUtils:
     """Test utility functions from the Docker module."""
 
+    def test_docker_file_manager_is_lazily_exported(self):
+        """Test that the file manager is still reachable from the package."""
+        from sapo.cli.install_mode import docker
+        from sapo.cli.install_mode.docker.files import DockerFileManager
+
+        assert docker.DockerFileManager is DockerFileManager
+
     def test_check_disk_space(self):
         """Test the check_disk_space function."""
         # Create a temporary directory for testing
@@ -39,6 +50,31 @@ class TestDockerUtils:
         assert total_gb == 0.0
         assert percent_free == 0.0
 
+    @mock.patch("sapo.cli.install_mode.common.shutil.which")
+    def test_check_docker_installed_is_cached(self, mock_which):
+        """Test that repeated Docker checks reuse the cached probe."""
+        _docker_installed_bucket.cache_clear()
+        mock_which.return_value = "/usr/bin/docker"
+
+        try:
+            assert check_docker_installed() is True
+            assert check_docker_installed() is True
+            mock_which.assert_called_once_with("docker")
+        finally:
+            _docker_installed_bucket.cache_clear()
+
+    @mock.patch("sapo.cli.install_mode.common.run_docker_command")
+    @mock.patch("sapo.cli.install_mode.common.shutil.which", return_value=None)
+    def test_check_docker_installed_missing(self, mock_which, mock_run):
+        """Test that a missing Docker binary is detected without a subprocess."""
+        _docker_installed_bucket.cache_clear()
+
+        try:
+            assert check_docker_installed() is False
+            mock_run.assert_not_called()
+        finally:
+            _docker_installed_bucket.cache_clear()
+
     def test_generate_password(self):
         """Test the generate_password function."""
         # Get password for master key
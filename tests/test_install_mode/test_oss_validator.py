@@ -381,6 +381,39 @@ class TestArtifactoryOSSValidator:
         assert "shared.database.properties" in error_messages
         assert "OSS version" in error_messages
 
+    def test_invalid_oss_keys_reports_whole_subtree(self):
+        """Test that each invalid key gets one error listing its whole subtree."""
+        validator = ArtifactoryOSSValidator()
+
+        config = {
+            "artifactory": {
+                "port": 8081,
+                "cache": None,  # Present but empty
+                "pool": {"maxPoolSize": 100, "jdbc": {"timeout": 30}},
+            },
+        }
+
+        result = validator.validate(config)
+
+        oss_errors = [
+            error for error in result.errors if "not supported in OSS" in error
+        ]
+        assert sorted(oss_errors) == [
+            "Key 'artifactory.cache' is not supported in OSS version. "
+            "This key is only available in Pro/Enterprise editions.",
+            "Key 'artifactory.pool' (and 3 nested keys) is not supported in OSS "
+            "version. This key is only available in Pro/Enterprise editions.",
+        ]
+        assert result.details == {
+            "artifactory.cache": ["artifactory.cache"],
+            "artifactory.pool": [
+                "artifactory.pool",
+                "artifactory.pool.maxPoolSize",
+                "artifactory.pool.jdbc",
+                "artifactory.pool.jdbc.timeout",
+            ],
+        }
+
     def test_empty_config_validation(self):
         """Test validation with completely empty configuration."""
         validator = ArtifactoryOSSValidator()
@@ -412,10 +445,13 @@ class TestArtifactoryOSSValidator:
         assert validator._is_valid_join_key("a..b") is False
         assert validator._is_valid_join_key("a.b.") is False
         assert validator._is_valid_join_key(".a.b") is False
+        assert validator._is_valid_join_key("a.b.c.") is False
+        assert validator._is_valid_join_key("a..b.c") is False
 
         # Test valid cases
         assert validator._is_valid_join_key("a.b.c") is True
         assert validator._is_valid_join_key("prefix.algo.value") is True
+        assert validator._is_valid_join_key("a.b.c.d") is True
 
     def test_find_keys_recursive_functionality(self):
         """Test the _find_keys_recursive helper method functionality."""
@@ -437,6 +473,17 @@ class TestArtifactoryOSSValidator:
         ]
         assert set(keys) == set(expected_keys)
 
+    def test_iter_keys_recursive_is_lazy(self):
+        """Test that _iter_keys_recursive yields parents before their children."""
+        validator = ArtifactoryOSSValidator()
+
+        config = {"nested": {"deep": {"level3": "value3"}}, "other": 1}
+
+        keys = validator._iter_keys_recursive(config)
+
+        assert next(keys) == "nested"
+        assert list(keys) == ["nested.deep", "nested.deep.level3", "other"]
+
     def test_get_value_helper_method(self):
         """Test the _get_value helper method."""
         validator = ArtifactoryOSSValidator()
@@ -450,3 +497,26 @@ class TestArtifactoryOSSValidator:
         # Test non-existing values
         assert validator._get_value(config, "non_existing") is None
         assert validator._get_value(config, "nested.non_existing") is None
+
+        # Test default for missing keys, distinct from keys set to null
+        config["empty"] = None
+        assert validator._get_value(config, "nested.non_existing", "x") == "x"
+        assert validator._get_value(config, "empty", "x") is None
+
+    def test_required_key_set_to_null(self):
+        """Test that a required key set to null is present but not type checked."""
+        validator = ArtifactoryOSSValidator()
+
+        config = {
+            "configVersion": 1,
+            "shared": {
+                "security": {"joinKey": None},
+                "node": {"id": "node-1"},
+                "database": {"type": "derby"},
+            },
+        }
+
+        result = validator.validate(config)
+
+        error_messages = " ".join(result.errors)
+        assert "shared.security.joinKey" not in error_messages
@@ -5,9 +5,14 @@ These tests focus on comprehensive coverage of VolumeManager operations
 including edge cases, error scenarios, and data safety operations.
 """
 
+import asyncio
+import datetime
 import json
 import subprocess
+import tarfile
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -15,7 +20,11 @@ import pytest
 from rich.console import Console
 
 from sapo.cli.install_mode.common import OperationStatus
-from sapo.cli.install_mode.docker.volume import VolumeManager, VolumeType
+from sapo.cli.install_mode.docker.volume import (
+    VOLUME_INFO_TTL_SECONDS,
+    VolumeManager,
+    VolumeType,
+)
 
 
 class TestVolumeManagerDockerAvailability:
@@ -33,6 +42,18 @@ class TestVolumeManagerDockerAvailability:
             assert result is True
             mock_run.assert_called_once_with(["docker", "--version"])
 
+    def test_docker_availability_is_cached(self) -> None:
+        """Test that Docker is probed once per manager."""
+        manager = VolumeManager()
+
+        with patch.object(manager, "_run_command") as mock_run:
+            mock_run.side_effect = FileNotFoundError("docker: command not found")
+
+            assert manager.is_docker_available() is False
+            assert manager.is_docker_available() is False
+
+            mock_run.assert_called_once_with(["docker", "--version"])
+
     def test_docker_not_found_filenotfound(self) -> None:
         """Test Docker not found (FileNotFoundError)."""
         manager = VolumeManager()
@@ -219,6 +240,29 @@ class TestVolumeManagerCreation:
                 for label in label_args
             )
 
+    def test_create_volume_custom_label_overrides_default(self) -> None:
+        """Test that a custom label replaces the default label with its key."""
+        manager = VolumeManager()
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            manager.create_volume(
+                VolumeType.DATA,
+                labels={"com.jfrog.artifactory.managed-by": "other"},
+            )
+
+        cmd = mock_run.call_args[0][0]
+        label_args = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "--label"]
+        managed_by = [
+            label
+            for label in label_args
+            if label.startswith("com.jfrog.artifactory.managed-by=")
+        ]
+        assert managed_by == ["com.jfrog.artifactory.managed-by=other"]
+        assert len(label_args) == 4
+
     def test_create_volume_docker_unavailable_raises_error(self) -> None:
         """Test that volume creation raises error when Docker is unavailable."""
         manager = VolumeManager()
@@ -242,6 +286,66 @@ class TestVolumeManagerCreation:
             with pytest.raises(subprocess.CalledProcessError):
                 manager.create_volume(VolumeType.DATA)
 
+    def test_create_volume_set_creates_all_types(self) -> None:
+        """Test that a volume is created for every volume type."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        def create_volume(volume_type, name_suffix, **kwargs):
+            return f"artifactory_{volume_type.value}_{name_suffix}"
+
+        with patch.object(
+            manager, "create_volume", side_effect=create_volume
+        ) as mock_create:
+            volumes = manager.create_volume_set(name_suffix="test")
+
+        assert volumes == {
+            volume_type: f"artifactory_{volume_type.value}_test"
+            for volume_type in VolumeType
+            if volume_type != VolumeType.ALL
+        }
+        assert mock_create.call_count == 5
+
+    def test_create_volume_set_shares_timestamp(self) -> None:
+        """Test that the default suffix and install label use one timestamp."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        with patch.object(manager, "create_volume") as mock_create:
+            manager.create_volume_set()
+
+        suffixes = {call.args[1] for call in mock_create.call_args_list}
+        install_times = {
+            call.kwargs["labels"]["com.jfrog.artifactory.install-timestamp"]
+            for call in mock_create.call_args_list
+        }
+        assert len(suffixes) == 1
+        assert len(install_times) == 1
+        install_time = datetime.datetime.fromisoformat(install_times.pop())
+        assert install_time.strftime("%Y%m%d%H%M%S") == suffixes.pop()
+
+    def test_create_volume_set_rolls_back_on_failure(self) -> None:
+        """Test that volumes created before a failure are removed."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        def create_volume(volume_type, name_suffix, **kwargs):
+            if volume_type == VolumeType.BACKUP:
+                raise subprocess.CalledProcessError(1, "docker volume create")
+            return f"artifactory_{volume_type.value}_{name_suffix}"
+
+        with (
+            patch.object(manager, "create_volume", side_effect=create_volume),
+            patch.object(manager, "delete_volume") as mock_delete,
+        ):
+            with pytest.raises(RuntimeError, match="Failed to create volume set"):
+                manager.create_volume_set(name_suffix="test")
+
+        deleted = {call.args[0] for call in mock_delete.call_args_list}
+        assert deleted == {
+            "artifactory_data_test",
+            "artifactory_logs_test",
+            "artifactory_postgresql_test",
+            "artifactory_etc_test",
+        }
+
 
 class TestVolumeManagerListing:
     """Test volume listing and information retrieval."""
@@ -250,7 +354,17 @@ class TestVolumeManagerListing:
         """Test successful volume listing."""
         manager = VolumeManager(volume_prefix="test")
 
-        mock_output = "test_data_123,local,/var/lib/docker/volumes/test_data_123\ntest_logs_456,local,/var/lib/docker/volumes/test_logs_456"
+        mock_output = "\n".join(
+            json.dumps(
+                {
+                    "Name": name,
+                    "Driver": "local",
+                    "Mountpoint": f"/var/lib/docker/volumes/{name}",
+                    "Scope": "local",
+                }
+            )
+            for name in ("test_data_123", "test_logs_456")
+        )
 
         with (
             patch.object(manager, "is_docker_available", return_value=True),
@@ -272,6 +386,42 @@ class TestVolumeManagerListing:
             assert "ls" in cmd
             assert "--filter" in cmd
             assert "name=test" in cmd
+            assert cmd[-2:] == ["--format", "{{json .}}"]
+
+    def test_list_volumes_managed_only(self) -> None:
+        """Test that managed_only filters on the sapo label instead of the name."""
+        manager = VolumeManager(managed_only=True)
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout="")
+            assert manager.list_volumes() == []
+
+        cmd = mock_run.call_args[0][0]
+        filter_value = cmd[cmd.index("--filter") + 1]
+        assert filter_value == "label=com.jfrog.artifactory.managed-by=sapo"
+
+    def test_list_volumes_mountpoint_with_comma(self) -> None:
+        """Test that mountpoints containing commas are kept intact."""
+        manager = VolumeManager()
+
+        mock_output = json.dumps(
+            {"Name": "artifactory_data", "Driver": "local", "Mountpoint": "/mnt/a,b"}
+        )
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout=mock_output + "\n")
+
+            volumes = manager.list_volumes()
+
+        assert volumes == [
+            {"name": "artifactory_data", "driver": "local", "mountpoint": "/mnt/a,b"}
+        ]
 
     def test_list_volumes_empty_output(self) -> None:
         """Test volume listing with no volumes."""
@@ -290,8 +440,8 @@ class TestVolumeManagerListing:
         """Test volume listing with malformed output."""
         manager = VolumeManager()
 
-        # Output with insufficient columns
-        mock_output = "incomplete_line\ntest_volume,local"  # Missing mountpoint
+        # Output that is not JSON, or lacks the mountpoint
+        mock_output = 'incomplete_line\n{"Name": "test_volume", "Driver": "local"}'
 
         with (
             patch.object(manager, "is_docker_available", return_value=True),
@@ -342,6 +492,34 @@ class TestVolumeManagerListing:
             assert info["Driver"] == "local"
             assert "Labels" in info
 
+    def test_get_volume_info_is_cached(self) -> None:
+        """Test that repeated lookups reuse a recent inspect until invalidated."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout=json.dumps([{"Name": "test_volume"}]))
+
+            first = manager.get_volume_info("test_volume")
+            second = manager.get_volume_info("test_volume")
+            assert first == second == {"Name": "test_volume"}
+            assert mock_run.call_count == 1
+
+            # Deleting the volume drops its cached metadata
+            manager.delete_volume("test_volume")
+            manager.get_volume_info("test_volume")
+            assert mock_run.call_count == 3
+
+            # Entries expire after the TTL
+            with patch(
+                "sapo.cli.install_mode.docker.volume.time.monotonic",
+                return_value=time.monotonic() + VOLUME_INFO_TTL_SECONDS + 1,
+            ):
+                manager.get_volume_info("test_volume")
+            assert mock_run.call_count == 4
+
     def test_get_volume_info_not_found(self) -> None:
         """Test volume info retrieval when volume doesn't exist."""
         manager = VolumeManager()
@@ -368,6 +546,213 @@ class TestVolumeManagerListing:
             info = manager.get_volume_info("test_volume")
             assert info is None
 
+    def test_get_volumes_info_single_inspect(self) -> None:
+        """Test that several volumes are inspected with one command."""
+        manager = VolumeManager()
+
+        mock_volume_data = [
+            {"Name": "artifactory_data", "Labels": {}},
+            {"Name": "artifactory_logs", "Labels": {}},
+        ]
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            # One of the names is missing, so docker exits non-zero
+            mock_run.return_value = Mock(
+                returncode=1, stdout=json.dumps(mock_volume_data)
+            )
+
+            info = manager.get_volumes_info(
+                ["artifactory_data", "artifactory_logs", "missing"]
+            )
+
+        assert set(info) == {"artifactory_data", "artifactory_logs"}
+        mock_run.assert_called_once_with(
+            [
+                "docker",
+                "volume",
+                "inspect",
+                "artifactory_data",
+                "artifactory_logs",
+                "missing",
+            ],
+            check=False,
+        )
+
+    def test_display_volumes_inspects_once(self) -> None:
+        """Test that display_volumes batches the metadata lookup."""
+        manager = VolumeManager(console=Mock(spec=Console))
+        volumes = [
+            {"name": f"artifactory_{kind}", "driver": "local", "mountpoint": "/mnt"}
+            for kind in ("data", "logs", "etc")
+        ]
+        volumes_info = {
+            volume["name"]: {
+                "Name": volume["name"],
+                "Mountpoint": "/mnt",
+                "Labels": {"com.jfrog.artifactory.volume-type": "data"},
+            }
+            for volume in volumes
+        }
+
+        with (
+            patch.object(manager, "list_volumes", return_value=volumes),
+            patch.object(
+                manager, "get_volumes_info", return_value=volumes_info
+            ) as mock_info,
+            patch.object(manager, "get_volume_info") as mock_single_info,
+            patch.object(manager, "get_volume_sizes", return_value={}) as mock_sizes,
+        ):
+            manager.display_volumes()
+
+        mock_info.assert_called_once_with(
+            ["artifactory_data", "artifactory_logs", "artifactory_etc"]
+        )
+        mock_single_info.assert_not_called()
+        mock_sizes.assert_called_once_with(volumes_info)
+
+    def test_get_volume_sizes_uses_one_container(self, tmp_path: Path) -> None:
+        """Test that volumes not on this host share a single du container."""
+        manager = VolumeManager()
+        (tmp_path / "a.bin").write_bytes(b"x" * 100)
+        volumes_info = {
+            "artifactory_data": {"Driver": "local", "Mountpoint": str(tmp_path)},
+            "artifactory_logs": {"Driver": "local", "Mountpoint": "/nonexistent"},
+            "artifactory_etc": {"Driver": "nfs", "Mountpoint": "/nonexistent"},
+        }
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout="2048\t/volumes/0\n4096\t/volumes/1\n")
+            sizes = manager.get_volume_sizes(volumes_info)
+
+        data_size = sizes["artifactory_data"]
+        assert data_size is not None
+        assert data_size[0] == tmp_path.stat().st_size + 100
+        assert sizes["artifactory_logs"] == (2048, "2.00 KB")
+        assert sizes["artifactory_etc"] == (4096, "4.00 KB")
+        mock_run.assert_called_once_with(
+            [
+                "docker",
+                "run",
+                "--rm",
+                "-v",
+                "artifactory_logs:/volumes/0",
+                "-v",
+                "artifactory_etc:/volumes/1",
+                "alpine",
+                "du",
+                "-sb",
+                "/volumes/0",
+                "/volumes/1",
+            ],
+            check=False,
+        )
+
+    def test_get_volume_sizes_partial_du_output(self) -> None:
+        """Test that volumes du could not read are reported as unknown."""
+        manager = VolumeManager()
+        volumes_info = {
+            name: {"Driver": "local", "Mountpoint": "/nonexistent"}
+            for name in ("artifactory_data", "artifactory_logs")
+        }
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout="512\t/volumes/1\n")
+            sizes = manager.get_volume_sizes(volumes_info)
+
+        assert sizes == {
+            "artifactory_data": None,
+            "artifactory_logs": (512, "512.00 B"),
+        }
+
+    def test_get_volume_size_walks_local_mountpoint(self, tmp_path: Path) -> None:
+        """Test that local volumes are measured on the host without a container."""
+        manager = VolumeManager()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.bin").write_bytes(b"x" * 1000)
+        (tmp_path / "b.bin").write_bytes(b"y" * 24)
+        (tmp_path / "link.bin").hardlink_to(tmp_path / "b.bin")
+
+        volume_info = {"Driver": "local", "Mountpoint": str(tmp_path)}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            size = manager.get_volume_size("artifactory_data", volume_info)
+
+        expected = (
+            tmp_path.stat().st_size + (tmp_path / "sub").stat().st_size + 1000 + 24
+        )
+        assert size is not None
+        assert size[0] == expected
+        mock_run.assert_not_called()
+
+    def test_get_volume_size_falls_back_to_container(self) -> None:
+        """Test that unreadable mountpoints are measured with du in a container."""
+        manager = VolumeManager()
+
+        volume_info = {"Driver": "local", "Mountpoint": "/nonexistent/_data"}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout="2048 /volume\n")
+            size = manager.get_volume_size("artifactory_data", volume_info)
+
+        assert size == (2048, "2.00 KB")
+        assert mock_run.call_args.args[0][:3] == ["docker", "run", "--rm"]
+
+    @pytest.mark.parametrize(
+        ("du_bytes", "expected"),
+        [
+            (0, "0.00 B"),
+            (1024, "1024.00 B"),
+            (1025, "1.00 KB"),
+            (3 * 1024**3, "3.00 GB"),
+            (5 * 1024**5, "5120.00 TB"),
+        ],
+    )
+    def test_get_volume_size_units(self, du_bytes: int, expected: str) -> None:
+        """Test the unit chosen for human-readable volume sizes."""
+        manager = VolumeManager()
+
+        volume_info = {"Driver": "nfs", "Mountpoint": "/nonexistent"}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout=f"{du_bytes} /volume\n")
+            size = manager.get_volume_size("artifactory_data", volume_info)
+
+        assert size == (du_bytes, expected)
+
+    def test_get_volume_size_skips_bind_backed_volume(self, tmp_path: Path) -> None:
+        """Test that volumes with driver options are not walked on the host."""
+        manager = VolumeManager()
+
+        volume_info = {
+            "Driver": "local",
+            "Mountpoint": str(tmp_path),
+            "Options": {"type": "none", "o": "bind", "device": "/srv/data"},
+        }
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            mock_run.return_value = Mock(stdout="4096 /volume\n")
+            size = manager.get_volume_size("artifactory_data", volume_info)
+
+        assert size == (4096, "4.00 KB")
+        mock_run.assert_called_once()
+
 
 class TestVolumeManagerBackupRestore:
     """Test backup and restore operations."""
@@ -414,6 +799,13 @@ class TestVolumeManagerBackupRestore:
                 assert "alpine" in backup_cmd
                 assert "tar -cf" in " ".join(backup_cmd)
 
+                # The archive is streamed to the host instead of bind-mounting it
+                assert not any(arg.endswith(":/backup") for arg in backup_cmd)
+                assert backup_cmd[-4:] == ["-", "-C", "/source", "."]
+                backup_call = mock_run.call_args_list[0]
+                assert backup_call.kwargs["capture_output"] is False
+                assert backup_call.kwargs["stdout"].name == str(backup_file)
+
     def test_backup_volume_success_compressed(self) -> None:
         """Test successful volume backup with compression."""
         manager = VolumeManager()
@@ -427,6 +819,10 @@ class TestVolumeManagerBackupRestore:
                 patch.object(
                     manager, "get_volume_info", return_value={"Name": "test_volume"}
                 ),
+                patch(
+                    "sapo.cli.install_mode.docker.volume.shutil.which",
+                    return_value=None,
+                ),
             ):
                 status, backup_file = manager.backup_volume(
                     "test_volume", backup_path, compress=True
@@ -447,6 +843,43 @@ class TestVolumeManagerBackupRestore:
                 assert backup_cmd is not None
                 assert "tar -czf" in " ".join(backup_cmd)
 
+    def test_backup_volume_compressed_with_host_pigz(self) -> None:
+        """Test that compressed backups use host pigz when it is installed."""
+        manager = VolumeManager()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backup_path = Path(tmpdir)
+
+            with (
+                patch.object(manager, "is_docker_available", return_value=True),
+                patch.object(manager, "_run_command") as mock_run,
+                patch.object(manager, "get_volume_info", return_value=None),
+                patch(
+                    "sapo.cli.install_mode.docker.volume.shutil.which",
+                    return_value="/usr/bin/pigz",
+                ),
+                patch(
+                    "sapo.cli.install_mode.docker.volume.subprocess.Popen"
+                ) as mock_popen,
+            ):
+                pigz = mock_popen.return_value.__enter__.return_value
+                pigz.returncode = 0
+
+                status, backup_file = manager.backup_volume(
+                    "test_volume", backup_path, compress=True
+                )
+
+                assert status == OperationStatus.SUCCESS
+                assert backup_file is not None
+                assert backup_file.name.endswith(".tar.gz")
+
+                # The container streams plain tar into pigz on the host
+                backup_cmd = mock_run.call_args.args[0]
+                assert "tar -cf -" in " ".join(backup_cmd)
+                assert mock_run.call_args.kwargs["stdout"] is pigz.stdin
+                assert mock_popen.call_args.args[0][:2] == ["/usr/bin/pigz", "-p"]
+                pigz.stdin.close.assert_called_once()
+
     def test_backup_volume_docker_unavailable(self) -> None:
         """Test backup when Docker is unavailable."""
         manager = VolumeManager()
@@ -477,6 +910,8 @@ class TestVolumeManagerBackupRestore:
 
                 assert status == OperationStatus.ERROR
                 assert backup_file is None
+                # The partial archive is removed
+                assert list(backup_path.iterdir()) == []
 
     def test_restore_volume_to_existing_volume(self) -> None:
         """Test restoring backup to existing volume."""
@@ -558,6 +993,106 @@ class TestVolumeManagerBackupRestore:
                 cmd = mock_run.call_args[0][0]
                 assert "tar -xzf" in " ".join(cmd)
 
+    def test_restore_volume_extracts_on_host(self, tmp_path: Path) -> None:
+        """Test that local volumes are restored without a container."""
+        manager = VolumeManager()
+        source = tmp_path / "source"
+        (source / "etc").mkdir(parents=True)
+        (source / "etc" / "system.yaml").write_text("shared: {}")
+        backup_file = tmp_path / "artifactory_data_20240101120000.tar.gz"
+        with tarfile.open(backup_file, "w:gz") as archive:
+            archive.add(source, arcname=".")
+
+        mountpoint = tmp_path / "_data"
+        (mountpoint / "stale").mkdir(parents=True)
+        (mountpoint / ".hidden").write_text("old")
+        volume_info = {"Driver": "local", "Mountpoint": str(mountpoint)}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+            patch("sapo.cli.install_mode.docker.volume._is_root", return_value=True),
+        ):
+            status, volume_name = manager.restore_volume(
+                backup_file, volume_name="artifactory_data"
+            )
+
+        assert status == OperationStatus.SUCCESS
+        assert volume_name == "artifactory_data"
+        assert sorted(p.name for p in mountpoint.iterdir()) == ["etc"]
+        assert (mountpoint / "etc" / "system.yaml").read_text() == "shared: {}"
+        mock_run.assert_not_called()
+
+    def test_restore_volume_on_host_keeps_volume_for_bad_archive(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that an unreadable backup fails before the volume is wiped."""
+        manager = VolumeManager()
+        backup_file = tmp_path / "artifactory_data.tar.gz"
+        backup_file.write_text("not a tarball")
+
+        mountpoint = tmp_path / "_data"
+        mountpoint.mkdir()
+        (mountpoint / "keep").write_text("old")
+        volume_info = {"Driver": "local", "Mountpoint": str(mountpoint)}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+            patch("sapo.cli.install_mode.docker.volume._is_root", return_value=True),
+        ):
+            status, _ = manager.restore_volume(
+                backup_file, volume_name="artifactory_data"
+            )
+
+        assert status == OperationStatus.ERROR
+        assert (mountpoint / "keep").read_text() == "old"
+        mock_run.assert_not_called()
+
+    def test_restore_volume_non_root_uses_container(self, tmp_path: Path) -> None:
+        """Test that restores not running as root go through a container."""
+        manager = VolumeManager()
+        backup_file = tmp_path / "artifactory_data.tar"
+        backup_file.write_text("backup")
+
+        volume_info = {"Driver": "local", "Mountpoint": str(tmp_path)}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+            patch("sapo.cli.install_mode.docker.volume._is_root", return_value=False),
+        ):
+            status, _ = manager.restore_volume(
+                backup_file, volume_name="artifactory_data"
+            )
+
+        assert status == OperationStatus.SUCCESS
+        assert "tar -xf" in " ".join(mock_run.call_args[0][0])
+        assert backup_file.exists()
+
+    def test_restore_volume_bind_backed_uses_container(self, tmp_path: Path) -> None:
+        """Test that volumes with driver options are restored in a container."""
+        manager = VolumeManager()
+        backup_file = tmp_path / "artifactory_data.tar"
+        backup_file.write_text("backup")
+
+        volume_info = {
+            "Driver": "local",
+            "Mountpoint": str(tmp_path),
+            "Options": {"type": "none", "o": "bind", "device": "/srv/data"},
+        }
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            status, _ = manager.restore_volume(
+                backup_file, volume_name="artifactory_data"
+            )
+
+        assert status == OperationStatus.SUCCESS
+        assert "tar -xf" in " ".join(mock_run.call_args[0][0])
+
     def test_restore_volume_backup_not_found(self) -> None:
         """Test restore when backup file doesn't exist."""
         manager = VolumeManager()
@@ -666,6 +1201,46 @@ class TestVolumeManagerUtilities:
         assert manager.volume_prefix == "custom"
         assert "sapo" in manager.default_labels["com.jfrog.artifactory.managed-by"]
 
+    def test_analyze_data_usage_parses_du_output(self) -> None:
+        """Test that du lines are parsed, keeping names that contain spaces."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        du_output = (
+            "4.0K\t/volume/etc\n1.2G\t/volume/my data\n\n8.0K\t/volume/.hidden\n"
+        )
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+            patch.object(manager, "get_volume_size", return_value=(1, "1.00 B")),
+        ):
+            mock_run.return_value = Mock(stdout=du_output)
+            analysis = manager.analyze_data_usage("artifactory_data")
+
+        assert analysis["total_size"] == "1.00 B"
+        assert analysis["usage_data"] == [
+            {"path": "etc", "size": "4.0K"},
+            {"path": "my data", "size": "1.2G"},
+            {"path": ".hidden", "size": "8.0K"},
+        ]
+
+    def test_analyze_data_usage_total_from_same_container(self) -> None:
+        """Test that the total size comes from the du container itself."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        du_output = "4.0K\t/volume/etc\n2048\t/volume\n"
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+            patch.object(manager, "get_volume_size") as mock_size,
+        ):
+            mock_run.return_value = Mock(stdout=du_output)
+            analysis = manager.analyze_data_usage("artifactory_data")
+
+        assert analysis["total_size"] == "2.00 KB"
+        assert analysis["usage_data"] == [{"path": "etc", "size": "4.0K"}]
+        mock_run.assert_called_once()
+        mock_size.assert_not_called()
+
     def test_run_command_capture_output_false(self) -> None:
         """Test _run_command with capture_output=False."""
         manager = VolumeManager()
@@ -700,6 +1275,23 @@ class TestVolumeManagerUtilities:
                 ["docker", "version"], check=False, capture_output=True
             )
 
+    def test_run_command_discard_output(self) -> None:
+        """Test _run_command sends stdout to /dev/null with discard_output."""
+        manager = VolumeManager()
+
+        with patch(
+            "sapo.cli.install_mode.docker.volume.run_docker_command"
+        ) as mock_run:
+            manager._run_command(["docker", "volume", "rm", "x"], discard_output=True)
+
+            mock_run.assert_called_once_with(
+                ["docker", "volume", "rm", "x"],
+                check=True,
+                capture_output=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+
     def test_run_command_error_handling(self) -> None:
         """Test _run_command error handling and reporting."""
         manager = VolumeManager()
@@ -711,3 +1303,159 @@ class TestVolumeManagerUtilities:
 
                 with pytest.raises(subprocess.CalledProcessError):
                     manager._run_command(["docker", "fail"])
+
+    def test_migration_labels(self) -> None:
+        """Test the labels recording a bind mount migration."""
+        labels = VolumeManager.migration_labels(Path("/srv/artifactory/data"))
+
+        assert labels["com.jfrog.artifactory.migrated-from"] == "/srv/artifactory/data"
+        assert "com.jfrog.artifactory.migrated-at" in labels
+
+    @pytest.mark.asyncio
+    async def test_migrate_from_bind_mount_single_command(self) -> None:
+        """Test that migrating a bind mount only runs the copy container."""
+        manager = VolumeManager()
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            result = await manager.migrate_from_bind_mount(
+                Path(tmpdir), "artifactory_data_test", VolumeType.DATA
+            )
+
+        assert result is True
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][:3] == ["docker", "run", "--rm"]
+
+    @pytest.mark.asyncio
+    async def test_migrate_from_bind_mount_hardlinks(self, tmp_path: Path) -> None:
+        """Test that same-filesystem migrations link files instead of copying."""
+        manager = VolumeManager()
+        source = tmp_path / "source"
+        (source / "filestore").mkdir(parents=True)
+        (source / "filestore" / "blob").write_bytes(b"data")
+        mountpoint = tmp_path / "_data"
+        mountpoint.mkdir()
+
+        volume_info = {"Driver": "local", "Mountpoint": str(mountpoint)}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            result = await manager.migrate_from_bind_mount(
+                source, "artifactory_data_test", VolumeType.DATA, hardlink=True
+            )
+
+        assert result is True
+        mock_run.assert_not_called()
+        linked = mountpoint / "filestore" / "blob"
+        assert linked.read_bytes() == b"data"
+        assert linked.stat().st_ino == (source / "filestore" / "blob").stat().st_ino
+
+    @pytest.mark.asyncio
+    async def test_migrate_from_bind_mount_hardlink_falls_back(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that volumes not reachable on the host are copied in a container."""
+        manager = VolumeManager()
+
+        volume_info = {"Driver": "local", "Mountpoint": "/nonexistent/_data"}
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "get_volume_info", return_value=volume_info),
+            patch.object(manager, "_run_command") as mock_run,
+        ):
+            result = await manager.migrate_from_bind_mount(
+                tmp_path, "artifactory_data_test", VolumeType.DATA, hardlink=True
+            )
+
+        assert result is True
+        assert mock_run.call_args.args[0][:3] == ["docker", "run", "--rm"]
+
+    @pytest.mark.asyncio
+    async def test_migrate_data_runs_concurrently(self) -> None:
+        """Test that migrations do not block the event loop while copying."""
+        manager = VolumeManager(console=Mock(spec=Console))
+        # Both copies must be in progress at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def copy_volume(source_volume: str, target_volume: str) -> bool:
+            barrier.wait()
+            return True
+
+        with patch.object(manager, "_copy_volume", side_effect=copy_volume):
+            results = await asyncio.gather(
+                manager.migrate_data("artifactory_a", "artifactory_a2"),
+                manager.migrate_data("artifactory_b", "artifactory_b2"),
+            )
+
+        assert results == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_migrate_data_copies_directly(self) -> None:
+        """Test that volumes are migrated without an intermediate archive."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        with (
+            patch.object(manager, "is_docker_available", return_value=True),
+            patch.object(manager, "_run_command") as mock_run,
+            patch.object(manager, "backup_volume") as mock_backup,
+        ):
+            result = await manager.migrate_data("artifactory_old", "artifactory_new")
+
+        assert result is True
+        mock_backup.assert_not_called()
+        cmd = mock_run.call_args.args[0]
+        assert "artifactory_old:/source:ro" in cmd
+        assert "artifactory_new:/target" in cmd
+
+    @pytest.mark.asyncio
+    async def test_migrate_data_through_backup(self) -> None:
+        """Test that a temporary directory selects the backup and restore path."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backup_file = Path(tmpdir) / "artifactory_old.tar.gz"
+            backup_file.write_bytes(b"")
+
+            with (
+                patch.object(
+                    manager,
+                    "backup_volume",
+                    return_value=(OperationStatus.SUCCESS, backup_file),
+                ) as mock_backup,
+                patch.object(
+                    manager,
+                    "restore_volume",
+                    return_value=(OperationStatus.SUCCESS, "artifactory_new"),
+                ) as mock_restore,
+            ):
+                result = await manager.migrate_data(
+                    "artifactory_old", "artifactory_new", Path(tmpdir)
+                )
+
+            assert result is True
+            mock_backup.assert_called_once_with(
+                "artifactory_old", Path(tmpdir), compress=True
+            )
+            mock_restore.assert_called_once_with(backup_file, "artifactory_new")
+            # The archive is what --temp is for, so it is kept
+            assert backup_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_migrate_data_rejects_same_volume(self) -> None:
+        """Test that migrating a volume onto itself is refused before any copy."""
+        manager = VolumeManager(console=Mock(spec=Console))
+
+        with (
+            patch.object(manager, "_run_command") as mock_run,
+            patch.object(manager, "backup_volume") as mock_backup,
+        ):
+            result = await manager.migrate_data("artifactory_data", "artifactory_data")
+
+        assert result is False
+        mock_run.assert_not_called()
+        mock_backup.assert_not_called()
@@ -25,7 +25,8 @@ class TestVolumeManagerCritical:
             mock_run.return_value = Mock(stdout="Docker version 20.10.0")
             assert volume_manager.is_docker_available() is True
 
-        # Mock Docker not available
+        # Mock Docker not available (the probe result is cached per manager)
+        volume_manager._docker_available = None
         with patch.object(volume_manager, "_run_command") as mock_run:
             mock_run.side_effect = FileNotFoundError("docker not found")
             assert volume_manager.is_docker_available() is False
@@ -43,3 +43,10 @@ def test_format_size_precision():
     """Test formatting with different precisions."""
     assert format_size(1024 * 1024 * 1.5) == "1.50 MB"
     assert format_size(1024 * 1024 * 1.234) == "1.23 MB"
+
+
+def test_format_size_unit_boundaries():
+    """Test sizes just below a unit and beyond the largest unit."""
+    assert format_size(1024 * 1024 - 1) == "1024.00 KB"
+    assert format_size(1024 * 1024 * 1024 - 1) == "1024.00 MB"
+    assert format_size(1024**4) == "1024.00 GB"